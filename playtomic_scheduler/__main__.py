@@ -27,6 +27,11 @@ def cli():
 cli.add_command(init)
 cli.add_command(reserve)
 cli.add_command(schedule_cmd)
+cli.add_command(plan)
+cli.add_command(watch)
+cli.add_command(replay)
+cli.add_command(serve)
+cli.add_command(loadtest)
 
 if __name__ == "__main__":
     cli()
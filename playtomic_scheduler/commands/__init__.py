@@ -1,3 +1,8 @@
 from .init import init
 from .reserve import reserve
 from .schedule import schedule_cmd
+from .plan import plan
+from .watch import watch
+from .replay import replay
+from .serve import serve
+from .loadtest import loadtest
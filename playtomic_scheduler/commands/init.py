@@ -5,9 +5,11 @@ import logging
 
 # 3rd party imports
 import click
+from pydantic import ValidationError
 from requests.exceptions import HTTPError
 
 # Project imports
+from playtomic_scheduler.config import Profile, describe_errors
 from playtomic_scheduler.utils.directory import setup_dir
 from playtomic_scheduler.helpers.playtomic import Playtomic
 
@@ -89,5 +91,11 @@ def init():
         config["duration"] = duration
         config["reservations_per_week"] = reservations_per_week
 
+        try:
+            Profile.model_validate(config)
+        except ValidationError as err:
+            click.echo(f"Invalid preferences: {describe_errors(err)}")
+            return
+
     with open(config_file_path, "w") as config_file:
         config_file.write(json.dumps(config))
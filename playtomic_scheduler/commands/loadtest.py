@@ -0,0 +1,307 @@
+# Native imports
+import json
+import time
+import socket
+import logging
+import tempfile
+import tracemalloc
+import multiprocessing
+from pathlib import Path
+from typing import Dict, Text, Optional
+
+# 3rd party imports
+import click
+import requests
+from requests.exceptions import RequestException
+
+# Project imports
+from playtomic_scheduler.config import settings
+from playtomic_scheduler.helpers.fakeapi import build_catalogue, serve_fake_api
+from playtomic_scheduler.helpers.loadtest import (
+    LoadTest,
+    LoadTestReport,
+    build_profiles,
+)
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+# Constants
+STARTUP_TIMEOUT = 10
+
+
+def _get_free_port() -> int:
+    """
+    Get a free local TCP port.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_api(stats_url: Text) -> bool:
+    """
+    Wait until the API stand-in answers its stats endpoint.
+    """
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            requests.get(stats_url, timeout=1).raise_for_status()
+            return True
+        except RequestException:
+            time.sleep(0.1)
+
+    return False
+
+
+def _get_peak_rss() -> Optional[float]:
+    """
+    Get the resident memory high-water mark of the process in KiB.
+    """
+    if resource is None:
+        return None
+
+    return float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def _format_ms(seconds: Optional[float]) -> Text:
+    """
+    Format a latency in milliseconds.
+    """
+    return "-" if seconds is None else f"{seconds * 1000:.1f} ms"
+
+
+def _format_report(report: Dict) -> Text:
+    """
+    Format the report as a plain text table.
+    """
+
+    def value(key: Text, unit: Text = "") -> Text:
+        if report.get(key) is None:
+            return "-"
+        if isinstance(report[key], float):
+            return f"{report[key]:.1f}{unit}"
+        return f"{report[key]}{unit}"
+
+    rows = [
+        ("agents", value("agents")),
+        ("rounds", value("rounds")),
+        ("elapsed", value("elapsed", " s")),
+        ("scans", value("scans")),
+        ("scans/s", value("scans_per_second")),
+        ("requests", value("requests")),
+        ("requests/s", value("requests_per_second")),
+        ("scan p50", _format_ms(report["scan_p50"])),
+        ("scan p99", _format_ms(report["scan_p99"])),
+        ("booking attempts", value("booking_attempts")),
+        ("bookings", value("bookings")),
+        ("booking p50", _format_ms(report["booking_p50"])),
+        ("booking p99", _format_ms(report["booking_p99"])),
+        ("double booking attempts", value("conflicts")),
+        ("over quota bookings", value("over_quota")),
+        ("errors", value("errors")),
+        ("peak rss", value("peak_rss_kib", " KiB")),
+        ("peak traced memory", value("peak_traced_kib", " KiB")),
+    ]
+
+    width = max(len(name) for name, _ in rows)
+    return "\n".join(f"{name.ljust(width)}  {row_value}" for name, row_value in rows)
+
+
+@click.command("loadtest")
+@click.option(
+    "-n",
+    "--agents",
+    type=click.IntRange(min=1),
+    default=10,
+    help="How many booking agents should run concurrently",
+)
+@click.option(
+    "-r",
+    "--rounds",
+    type=click.IntRange(min=1),
+    default=1,
+    help="How many full checks should every agent run",
+)
+@click.option(
+    "--tenants",
+    "tenant_count",
+    type=click.IntRange(min=1),
+    default=5,
+    help="Number of clubs of the synthetic catalogue",
+)
+@click.option(
+    "--courts",
+    "court_count",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Number of courts of every club of the synthetic catalogue",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=0,
+    help="Seed of the synthetic catalogue and preferences",
+)
+@click.option(
+    "--api-url",
+    type=str,
+    required=False,
+    help="Base URL of a running API stand-in (e.g. http://host:8000/api)",
+)
+@click.option(
+    "--port",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Port of the local API stand-in (a free port by default)",
+)
+@click.option(
+    "--latency",
+    type=click.FloatRange(min=0),
+    default=20,
+    help="Latency added to every response of the local API stand-in (in ms)",
+)
+@click.option(
+    "--occupancy",
+    type=click.FloatRange(min=0, max=1),
+    default=0.5,
+    help="Share of the slots already taken in the local API stand-in",
+)
+@click.option(
+    "--server-threads",
+    type=click.IntRange(min=1),
+    default=16,
+    help="Number of threads serving the local API stand-in",
+)
+@click.option(
+    "--horizon",
+    type=click.IntRange(min=1),
+    required=False,
+    help="How many days ahead should the agents scan",
+)
+@click.option(
+    "--tracemalloc",
+    "trace_memory",
+    is_flag=True,
+    help="Trace the Python memory high-water mark (slows the agents down)",
+)
+@click.option(
+    "--serve-only",
+    is_flag=True,
+    help="Only serve the API stand-in, to load test it from other hosts",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Choice(["table", "json"]),
+    default="table",
+    help="Output format of the report",
+)
+def loadtest(
+    agents: int,
+    rounds: int,
+    tenant_count: int,
+    court_count: int,
+    seed: int,
+    api_url: Optional[Text],
+    port: int,
+    latency: float,
+    occupancy: float,
+    server_threads: int,
+    horizon: Optional[int],
+    trace_memory: bool,
+    serve_only: bool,
+    output: Text,
+):
+    """
+    Simulate concurrent booking agents against a local API stand-in.
+    """
+    server_args = (
+        tenant_count,
+        court_count,
+        seed,
+        latency / 1000,
+        occupancy,
+    )
+
+    if serve_only:
+        port = port or settings.port
+        logger.info("Serving API stand-in on http://0.0.0.0:%s/api", port)
+        serve_fake_api("0.0.0.0", port, server_threads, *server_args)
+        return
+
+    server = None
+    if not api_url:
+        port = port or _get_free_port()
+        api_url = f"http://127.0.0.1:{port}/api"
+        server = multiprocessing.Process(
+            target=serve_fake_api,
+            args=("127.0.0.1", port, server_threads, *server_args),
+            daemon=True,
+        )
+        server.start()
+
+    api_url = api_url.rstrip("/")
+    stats_url = f"{api_url}/loadtest/stats"
+
+    try:
+        if server and not _wait_for_api(stats_url):
+            logger.info("The API stand-in did not start on port %s.", port)
+            return
+
+        profiles = build_profiles(
+            agents, build_catalogue(tenant_count, court_count, seed), seed
+        )
+        logger.info(
+            "Running %s agents against %s (%s clubs, %s courts each)...",
+            agents,
+            api_url,
+            tenant_count,
+            court_count,
+        )
+
+        with tempfile.TemporaryDirectory() as state_dir:
+            load_test = LoadTest(
+                profiles,
+                f"{api_url}/v1",
+                f"{api_url}/v3",
+                Path(state_dir),
+                stats_url=stats_url,
+                rounds=rounds,
+                horizon_days=horizon,
+            )
+
+            if trace_memory:
+                tracemalloc.start()
+
+            # The agents would flood the output with their scan logs
+            logger.disabled = True
+            try:
+                report: LoadTestReport = load_test.run()
+            finally:
+                logger.disabled = False
+
+            peak_traced = None
+            if trace_memory:
+                _, peak_traced = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+    finally:
+        if server:
+            server.terminate()
+            server.join()
+
+    report = {
+        **report,
+        "peak_rss_kib": _get_peak_rss(),
+        "peak_traced_kib": None if peak_traced is None else peak_traced / 1024,
+    }
+
+    if output == "json":
+        click.echo(json.dumps(report, indent=2))
+        return
+
+    click.echo(_format_report(report))
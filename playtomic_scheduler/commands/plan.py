@@ -0,0 +1,199 @@
+# Native imports
+import io
+import csv
+import json
+import logging
+from datetime import datetime
+from typing import Text, Optional, List, Dict, Iterable
+
+# 3rd party imports
+import click
+from pydantic import ValidationError
+
+# Project imports
+from playtomic_scheduler.config import (
+    Tenant,
+    ConfigError,
+    load_profile,
+    describe_errors,
+)
+from playtomic_scheduler.utils import directory
+from playtomic_scheduler.helpers.reserver import Reserver
+from playtomic_scheduler.helpers.planner import Planner
+from playtomic_scheduler.helpers.playtomic import Playtomic
+from playtomic_scheduler.helpers.recorder import get_recording_path
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+# Constants
+COLUMNS = ["tenant", "court", "start", "duration", "price"]
+
+
+def _to_rows(slots: List[Dict], tenants: Iterable[Tenant]) -> List[Dict]:
+    """
+    Convert the planned slots to printable rows.
+    """
+    tenant_names = {tenant.id: tenant.name for tenant in tenants}
+    return [
+        {
+            "tenant": tenant_names.get(slot["tenant_id"], slot["tenant_id"]),
+            "court": slot["resource_id"],
+            "start": slot["start_date"].isoformat(),
+            "duration": slot["duration"],
+            "price": slot["price"],
+        }
+        for slot in slots
+    ]
+
+
+def _format_table(rows: List[Dict]) -> Text:
+    """
+    Format the rows as a plain text table.
+    """
+    widths = {
+        column: max([len(column)] + [len(str(row[column])) for row in rows])
+        for column in COLUMNS
+    }
+    lines = ["  ".join(column.upper().ljust(widths[column]) for column in COLUMNS)]
+    for row in rows:
+        lines.append(
+            "  ".join(str(row[column]).ljust(widths[column]) for column in COLUMNS)
+        )
+
+    lines = [line.rstrip() for line in lines]
+
+    return "\n".join(lines)
+
+
+def _format_csv(rows: List[Dict]) -> Text:
+    """
+    Format the rows as CSV.
+    """
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=COLUMNS)
+    writer.writeheader()
+    writer.writerows(rows)
+    return output.getvalue()
+
+
+@click.command("plan")
+@click.option(
+    "-f",
+    "--from",
+    "from_date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    required=False,
+    help="First day of the range to plan (defaults to today)",
+)
+@click.option(
+    "-t",
+    "--to",
+    "to_date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    required=False,
+    help="Last day of the range to plan, inclusive (defaults to 6 days after the first day)",
+)
+@click.option(
+    "-d",
+    "--days",
+    type=str,
+    required=False,
+    help="Which days of the week would you like to plan? (e.g. 2,3 for Tue and Wed)",
+)
+@click.option(
+    "-h",
+    "--hours",
+    type=str,
+    required=False,
+    help="At which starting hours would you like to play? (e.g. 20:00)",
+)
+@click.option(
+    "-u",
+    "--duration",
+    type=click.Choice(["1", "1.5", "2"]),
+    required=False,
+    help="How many hours would you like to play",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Choice(["table", "json", "csv"]),
+    default="table",
+    help="Output format of the matching slots",
+)
+@click.option(
+    "-c",
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=8,
+    help="How many availability requests can run at the same time",
+)
+@click.option(
+    "--scan-mode",
+    type=click.Choice(["day", "range"]),
+    required=False,
+    help="Request availability one day at a time or in multi-day ranges",
+)
+@click.option(
+    "--record",
+    type=str,
+    required=False,
+    help="Record the API traffic (without credentials) under this name",
+)
+def plan(
+    from_date: Optional[datetime],
+    to_date: Optional[datetime],
+    days: Optional[Text],
+    hours: Optional[Text],
+    duration: Optional[Text],
+    output: Text,
+    concurrency: int,
+    scan_mode: Optional[Text],
+    record: Optional[Text],
+):
+    """
+    List every bookable court matching your preferences without booking.
+    """
+    config_path = directory.setup_dir()
+    config_file_path = config_path.joinpath("config.json")
+
+    if not config_file_path.exists():
+        logger.info(
+            "You need to initialize the CLI first. Run `playtomic-scheduler init`."
+        )
+        return
+
+    try:
+        profile = load_profile(
+            config_file_path, days=days, hours=hours, duration=duration
+        )
+    except ValidationError as err:
+        logger.info("Invalid configuration: %s", describe_errors(err))
+        return
+    except ConfigError as err:
+        logger.info("Invalid configuration: %s", err)
+        return
+
+    playtomic = Playtomic(profile.email, profile.password)
+    if record:
+        playtomic.record(get_recording_path(record))
+    playtomic.login()
+
+    from_date, default_to_date = Planner.get_default_range(from_date)
+    to_date = to_date or default_to_date
+
+    reserver = Reserver(playtomic, profile, scan_mode=scan_mode)
+    planner = Planner(reserver, concurrency)
+    rows = _to_rows(planner.plan(profile.tenants, from_date, to_date), profile.tenants)
+    if planner.failed_windows:
+        logger.info(
+            "%s windows could not be fetched and are missing from the plan.",
+            len(planner.failed_windows),
+        )
+
+    if output == "json":
+        click.echo(json.dumps(rows, indent=2))
+    elif output == "csv":
+        click.echo(_format_csv(rows), nl=False)
+    else:
+        click.echo(_format_table(rows))
@@ -0,0 +1,126 @@
+# Native imports
+import io
+import pstats
+import logging
+import cProfile
+import tracemalloc
+from typing import Text
+
+# 3rd party imports
+import click
+from pydantic import ValidationError
+from requests.exceptions import HTTPError
+
+# Project imports
+from playtomic_scheduler.config import ConfigError, load_profile, describe_errors
+from playtomic_scheduler.utils import directory
+from playtomic_scheduler.helpers.reserver import Reserver
+from playtomic_scheduler.helpers.planner import Planner
+from playtomic_scheduler.helpers.playtomic import Playtomic
+from playtomic_scheduler.helpers.recorder import get_recording_path
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+
+@click.command("replay")
+@click.argument("name", type=str)
+@click.option(
+    "-l",
+    "--latency-scale",
+    type=click.FloatRange(min=0),
+    default=1.0,
+    help="Multiplier of the recorded latencies (0 serves responses instantly)",
+)
+@click.option(
+    "-p",
+    "--profiler",
+    type=click.Choice(["none", "cprofile", "tracemalloc"]),
+    default="none",
+    help="Profile the replayed scan",
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=1),
+    default=25,
+    help="How many entries of the profile should be printed",
+)
+def replay(name: Text, latency_scale: float, profiler: Text, top: int):
+    """
+    Replay the availability scan of a recording offline (nothing is
+    booked), optionally under a profiler.
+    """
+    config_path = directory.setup_dir()
+    config_file_path = config_path.joinpath("config.json")
+    recording_path = get_recording_path(name)
+
+    if not config_file_path.exists():
+        logger.info(
+            "You need to initialize the CLI first. Run `playtomic-scheduler init`."
+        )
+        return
+
+    if not recording_path.exists():
+        logger.info("Recording %s does not exist.", recording_path)
+        return
+
+    try:
+        profile = load_profile(config_file_path)
+    except ValidationError as err:
+        logger.info("Invalid configuration: %s", describe_errors(err))
+        return
+    except ConfigError as err:
+        logger.info("Invalid configuration: %s", err)
+        return
+
+    # Replayed traffic never reaches the API, so it is not rate limited
+    playtomic = Playtomic(profile.email, profile.password, limiter=False)
+    playtomic.replay(recording_path, latency_scale)
+
+    # Scan like `plan` so recorded bookings are never replayed. A single
+    # worker keeps the scan in this thread, where the profilers run.
+    planner = Planner(Reserver(playtomic, profile), max_workers=1)
+    from_date, to_date = Planner.get_default_range()
+
+    def replay_scan():
+        """
+        Run the scan of every tenant against the recording.
+        """
+        playtomic.login()
+        slots = planner.plan(profile.tenants, from_date, to_date)
+        logger.info("Replayed scan found %s matching slots.", len(slots))
+
+    try:
+        if profiler == "cprofile":
+            cprofile = cProfile.Profile()
+            cprofile.runcall(replay_scan)
+
+            output = io.StringIO()
+            stats = pstats.Stats(cprofile, stream=output)
+            stats.sort_stats("cumulative").print_stats(top)
+            click.echo(output.getvalue())
+        elif profiler == "tracemalloc":
+            tracemalloc.start()
+            replay_scan()
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            for stat in snapshot.statistics("lineno")[:top]:
+                click.echo(str(stat))
+            click.echo(f"Peak memory: {peak / 1024:.1f} KiB")
+        else:
+            replay_scan()
+    except HTTPError as err:
+        logger.info(
+            "Recording %s has no response for %s %s.",
+            name,
+            err.request.method,
+            err.request.url,
+        )
+        return
+
+    if planner.failed_windows:
+        logger.info(
+            "%s windows are not in the recording and were skipped.",
+            len(planner.failed_windows),
+        )
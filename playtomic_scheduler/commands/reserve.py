@@ -1,16 +1,20 @@
 # Native imports
-import json
 import logging
 from typing import Text, Optional
 
 # 3rd party imports
 import click
+from pydantic import ValidationError
 
 # Project imports
-from playtomic_scheduler.config import settings
+from playtomic_scheduler.config import ConfigError, load_profile, describe_errors
 from playtomic_scheduler.utils import directory
+from playtomic_scheduler.helpers.lease import LeaseStore
+from playtomic_scheduler.helpers.checkpoint import CheckpointStore
 from playtomic_scheduler.helpers.reserver import Reserver
+from playtomic_scheduler.helpers.coordinator import Coordinator
 from playtomic_scheduler.helpers.playtomic import Playtomic
+from playtomic_scheduler.helpers.recorder import get_recording_path
 
 logger = logging.getLogger("playtomic-scheduler-cli")
 
@@ -37,10 +41,53 @@ logger = logging.getLogger("playtomic-scheduler-cli")
     required=False,
     help="How many hours would you like to reserve the court for",
 )
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="How many worker processes should scan the tenants",
+)
+@click.option(
+    "--shard-index",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Index of the share of the scan work handled by this host",
+)
+@click.option(
+    "--shard-count",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of hosts sharing the scan work",
+)
+@click.option(
+    "--horizon",
+    type=click.IntRange(min=1),
+    required=False,
+    help="How many days ahead should be scanned for available courts",
+)
+@click.option(
+    "--scan-mode",
+    type=click.Choice(["day", "range"]),
+    required=False,
+    help="Request availability one day at a time or in multi-day ranges",
+)
+@click.option(
+    "--record",
+    type=str,
+    required=False,
+    help="Record the API traffic (without credentials) under this name",
+)
 def reserve(
     days: Optional[Text],
     hours: Optional[Text],
     duration: Optional[Text],
+    workers: int,
+    shard_index: int,
+    shard_count: int,
+    horizon: Optional[int],
+    scan_mode: Optional[Text],
+    record: Optional[Text],
 ):
     """
     Reserve court through Playtomic based on provided configuration.
@@ -54,22 +101,40 @@ def reserve(
         )
         return
 
-    with open(config_file_path, "r") as config_file:
-        config = json.load(config_file)
+    try:
+        profile = load_profile(
+            config_file_path, days=days, hours=hours, duration=duration
+        )
+    except ValidationError as err:
+        logger.info("Invalid configuration: %s", describe_errors(err))
+        return
+    except ConfigError as err:
+        logger.info("Invalid configuration: %s", err)
+        return
 
-    playtomic = Playtomic(config["email"], config["password"])
+    playtomic = Playtomic(profile.email, profile.password)
+    if record:
+        playtomic.record(get_recording_path(record))
     playtomic.login()
 
-    days = days or config.get("days")
-    hours = hours or config.get("hours")
-    duration = duration or config.get("duration")
-    reservations_per_week = config.get("reservations_per_week") or 1
+    reserver = Reserver(
+        playtomic,
+        profile,
+        lease=LeaseStore(),
+        horizon_days=horizon,
+        scan_mode=scan_mode,
+        checkpoint=CheckpointStore(),
+    )
 
-    if not days or not hours or not duration:
-        logger.info("You need to provide all the required options.")
+    # Settle the bookings left in flight by a previous run before scanning
+    if reserver.resume():
+        logger.info("A pending reservation was confirmed. Nothing left to do.")
         return
 
-    reserver = Reserver(playtomic, days, hours, duration)
+    if workers > 1 or shard_count > 1:
+        coordinator = Coordinator(reserver, workers, shard_index, shard_count)
+        coordinator.run(profile.tenants)
+        return
 
-    for tenant in settings.tenants:
-        reserver.process_tenant(tenant, reservations_per_week)
+    for tenant in profile.tenants:
+        reserver.process_tenant(tenant)
@@ -1,16 +1,26 @@
 # Native imports
-import json
 import time
+import signal
 import logging
+from typing import Text, Optional, Tuple
 
 # 3rd party imports
 import click
-import schedule
+from pydantic import ValidationError
 
 # Project imports
-from playtomic_scheduler.config import settings
-from playtomic_scheduler.utils import directory
+from playtomic_scheduler.config import (
+    Profile,
+    ConfigError,
+    load_profile,
+    describe_errors,
+)
+from playtomic_scheduler.utils import date, directory
+from playtomic_scheduler.utils.scheduler import Scheduler
+from playtomic_scheduler.helpers.lease import LeaseStore
+from playtomic_scheduler.helpers.checkpoint import CheckpointStore
 from playtomic_scheduler.helpers.reserver import Reserver
+from playtomic_scheduler.helpers.coordinator import Coordinator
 from playtomic_scheduler.helpers.playtomic import Playtomic
 
 logger = logging.getLogger("playtomic-scheduler-cli")
@@ -24,7 +34,54 @@ logger = logging.getLogger("playtomic-scheduler-cli")
     default=10,
     help="How often should the scheduler check for available courts (in minutes)",
 )
-def schedule_cmd(minutes: int):
+@click.option(
+    "-a",
+    "--at",
+    "at_hours",
+    type=str,
+    multiple=True,
+    help="Also check every day at this time, e.g. when courts are released (HH:MM)",
+)
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="How many worker processes should scan the tenants",
+)
+@click.option(
+    "--shard-index",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Index of the share of the scan work handled by this host",
+)
+@click.option(
+    "--shard-count",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of hosts sharing the scan work",
+)
+@click.option(
+    "--horizon",
+    type=click.IntRange(min=1),
+    required=False,
+    help="How many days ahead should be scanned for available courts",
+)
+@click.option(
+    "--scan-mode",
+    type=click.Choice(["day", "range"]),
+    required=False,
+    help="Request availability one day at a time or in multi-day ranges",
+)
+def schedule_cmd(
+    minutes: int,
+    at_hours: Tuple[Text, ...],
+    workers: int,
+    shard_index: int,
+    shard_count: int,
+    horizon: Optional[int],
+    scan_mode: Optional[Text],
+):
     """
     Schedule reservation checks until a reservation is confirmed.
     """
@@ -37,34 +94,109 @@ def schedule_cmd(minutes: int):
         )
         return
 
-    with open(config_file_path, "r") as config_file:
-        config = json.load(config_file)
-
-    playtomic = Playtomic(config["email"], config["password"])
-    playtomic.login()
+    try:
+        profile = load_profile(config_file_path)
+        at_times = [date.parse_time(at_hour) for at_hour in at_hours]
+    except ValidationError as err:
+        logger.info("Invalid configuration: %s", describe_errors(err))
+        return
+    except ConfigError as err:
+        logger.info("Invalid configuration: %s", err)
+        return
+    except ValueError as err:
+        logger.info("Invalid --at option: %s", err)
+        return
 
-    days = config.get("days")
-    hours = config.get("hours")
-    duration = config.get("duration")
-    reservations_per_week = config.get("reservations_per_week") or 1
+    checkpoint = CheckpointStore()
 
-    if not days or not hours or not duration:
-        logger.info("You need to provide all the required options.")
-        return
+    def build_reserver(profile: Profile):
+        """
+        Setup the reserver for the provided profile.
+        """
+        playtomic = Playtomic(profile.email, profile.password)
+        return Reserver(
+            playtomic,
+            profile,
+            lease=LeaseStore(),
+            horizon_days=horizon,
+            scan_mode=scan_mode,
+            checkpoint=checkpoint,
+        )
 
-    reserver = Reserver(playtomic, days, hours, duration)
+    state = {"reserver": build_reserver(profile)}
 
     def reservation_check():
         """
         Check for available courts and reserve them if available.
         """
+        if scheduler.stopped:
+            return
+
+        reserver = state["reserver"]
+
+        # Reload the preferences only when the configuration file changed
+        try:
+            profile = load_profile(config_file_path)
+        except ValidationError as err:
+            logger.info("Ignoring invalid configuration: %s", describe_errors(err))
+            profile = reserver.profile
+        except ConfigError as err:
+            logger.info("Ignoring invalid configuration: %s", err)
+            profile = reserver.profile
+
+        if profile is not reserver.profile:
+            logger.info("Configuration changed. Reloading preferences...")
+            reserver = state["reserver"] = build_reserver(profile)
+
         reserver.playtomic.login()
-        for tenant in settings.tenants:
-            reserver.process_tenant(tenant, reservations_per_week)
+        if workers > 1 or shard_count > 1:
+            coordinator = Coordinator(reserver, workers, shard_index, shard_count)
+            coordinator.run(profile.tenants)
+        else:
+            for tenant in profile.tenants:
+                reserver.process_tenant(tenant)
+
+        # Only completed checks count when resuming after a restart
+        if not reserver.stopping:
+            checkpoint.set_checked(profile.email)
+
+    scheduler = Scheduler()
+
+    def shutdown(signum: int, _frame):
+        """
+        Stop the scheduler once the step in progress is finished. A second
+        signal falls back to the default handler.
+        """
+        logger.info(
+            "Received %s. Stopping after the current step...",
+            signal.Signals(signum).name,
+        )
+        scheduler.stop()
+        state["reserver"].stop()
+        signal.signal(signum, handlers[signum])
+
+    handlers = {
+        signum: signal.signal(signum, shutdown)
+        for signum in (signal.SIGINT, signal.SIGTERM)
+    }
+
+    # Settle the bookings left in flight by a previous run before scanning
+    reserver = state["reserver"]
+    reserver.playtomic.login()
+    if reserver.resume():
+        logger.info("A pending reservation was confirmed. Nothing left to do.")
+        return
+
+    # Keep the cadence of the previous run instead of starting cold
+    interval = minutes * 60
+    checked_at = checkpoint.get_checked(profile.email)
+    delay = None
+    if checked_at is not None:
+        delay = interval - (time.time() - checked_at)
 
-    schedule.every(minutes).minutes.do(reservation_check)
+    scheduler.every(interval, reservation_check, delay=delay)
+    for at_time in at_times:
+        scheduler.daily(at_time, reservation_check)
 
     logger.info("Starting scheduler! Running checks every %s minutes...", minutes)
-    while reserver.reservation_confirmed is False:
-        schedule.run_pending()
-        time.sleep(1)
+    scheduler.run(until=lambda: state["reserver"].reservation_confirmed)
@@ -0,0 +1,75 @@
+# Native imports
+import logging
+from typing import Text, Optional
+
+# 3rd party imports
+import click
+from pydantic import ValidationError
+from waitress import serve as waitress_serve
+
+# Project imports
+from playtomic_scheduler.config import (
+    settings,
+    ConfigError,
+    load_profile,
+    describe_errors,
+)
+from playtomic_scheduler.utils import directory
+from playtomic_scheduler.helpers.reserver import Reserver
+from playtomic_scheduler.helpers.playtomic import Playtomic
+from playtomic_scheduler.server import create_app
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+
+@click.command("serve")
+@click.option(
+    "--host",
+    type=str,
+    default="127.0.0.1",
+    help="Interface the API server should listen on",
+)
+@click.option(
+    "-p",
+    "--port",
+    type=int,
+    required=False,
+    help="Port the API server should listen on (defaults to APP_PORT)",
+)
+@click.option(
+    "-t",
+    "--threads",
+    type=click.IntRange(min=1),
+    required=False,
+    help="Number of threads serving requests (defaults to APP_THREADS)",
+)
+def serve(host: Text, port: Optional[int], threads: Optional[int]):
+    """
+    Serve a REST API to query the availability of the configured tenants.
+    """
+    config_path = directory.setup_dir()
+    config_file_path = config_path.joinpath("config.json")
+
+    if not config_file_path.exists():
+        logger.info(
+            "You need to initialize the CLI first. Run `playtomic-scheduler init`."
+        )
+        return
+
+    try:
+        profile = load_profile(config_file_path)
+    except ValidationError as err:
+        logger.info("Invalid configuration: %s", describe_errors(err))
+        return
+    except ConfigError as err:
+        logger.info("Invalid configuration: %s", err)
+        return
+
+    playtomic = Playtomic(profile.email, profile.password)
+    playtomic.login()
+
+    app = create_app(Reserver(playtomic, profile))
+
+    port = port or settings.port
+    logger.info("Serving API on http://%s:%s/api", host, port)
+    waitress_serve(app, host=host, port=port, threads=threads or settings.threads)
@@ -0,0 +1,97 @@
+# Native imports
+import logging
+from typing import Text, Optional, Tuple
+
+# 3rd party imports
+import click
+from pydantic import ValidationError
+
+# Project imports
+from playtomic_scheduler.config import (
+    settings,
+    ConfigError,
+    load_profile,
+    describe_errors,
+)
+from playtomic_scheduler.utils import directory
+from playtomic_scheduler.utils.scheduler import Scheduler
+from playtomic_scheduler.helpers.reserver import Reserver
+from playtomic_scheduler.helpers.planner import Planner
+from playtomic_scheduler.helpers.watcher import Watcher
+from playtomic_scheduler.helpers.notifier import Notifier, create_sink
+from playtomic_scheduler.helpers.playtomic import Playtomic
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+
+@click.command("watch")
+@click.option(
+    "-i",
+    "--interval",
+    type=click.IntRange(min=1),
+    default=60,
+    help="How often should the watched courts be checked (in seconds)",
+)
+@click.option(
+    "-s",
+    "--sink",
+    "sinks",
+    type=str,
+    multiple=True,
+    default=["stdout"],
+    help="Where to deliver events: stdout, a webhook URL or unix:<socket path>",
+)
+@click.option(
+    "--horizon",
+    type=click.IntRange(min=1),
+    required=False,
+    help="How many days ahead should be watched",
+)
+def watch(interval: int, sinks: Tuple[Text, ...], horizon: Optional[int]):
+    """
+    Emit events when watched courts open, change price or get taken.
+    """
+    config_path = directory.setup_dir()
+    config_file_path = config_path.joinpath("config.json")
+
+    if not config_file_path.exists():
+        logger.info(
+            "You need to initialize the CLI first. Run `playtomic-scheduler init`."
+        )
+        return
+
+    try:
+        profile = load_profile(config_file_path)
+        notifier = Notifier([create_sink(sink) for sink in sinks])
+    except ValidationError as err:
+        logger.info("Invalid configuration: %s", describe_errors(err))
+        return
+    except ConfigError as err:
+        logger.info("Invalid configuration: %s", err)
+        return
+    except ValueError as err:
+        logger.info("%s", err)
+        return
+
+    playtomic = Playtomic(profile.email, profile.password)
+    playtomic.login()
+
+    watcher = Watcher(
+        Planner(Reserver(playtomic, profile)),
+        profile.get_watches(),
+        notifier,
+        horizon or settings.scan_horizon_days,
+    )
+
+    def watch_check():
+        """
+        Scan the tenants once and notify the changes.
+        """
+        playtomic.login()
+        watcher.poll(profile.tenants)
+
+    scheduler = Scheduler()
+    scheduler.every(interval, watch_check, delay=0)
+
+    logger.info("Watching %s rules every %s seconds...", len(watcher.rules), interval)
+    scheduler.run()
@@ -1 +1,8 @@
-from .config import settings
+from .config import settings, describe_errors
+from .profile import (
+    Profile,
+    Tenant,
+    WatchRule,
+    ConfigError,
+    load_profile,
+)
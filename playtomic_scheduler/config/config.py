@@ -1,8 +1,9 @@
 # Native imports
 from typing import Optional, Text, List, Dict
+from typing_extensions import Literal
 
 # 3rd party imports
-from pydantic import Field
+from pydantic import Field, ValidationError, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -13,9 +14,38 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
     )
 
+    # Server configuration
+    name: Text = Field(default="playtomic-scheduler", alias="APP_NAME")
+    env: Text = Field(default="dev", alias="APP_ENV")
+    port: int = Field(default=5000, alias="APP_PORT")
+    threads: int = Field(default=2, ge=1, alias="APP_THREADS")
+    cache_ttl: float = Field(default=60, ge=0, alias="PLAYTOMIC_CACHE_TTL")
+
     # CLI configuration
     config_path: Optional[Text] = Field(default=None, alias="PLAYTOMIC_SCHEDULER_PATH")
 
+    # API configuration
+    api_url: Text = Field(
+        default="https://playtomic.io/api/v1", alias="PLAYTOMIC_API_URL"
+    )
+    auth_url: Text = Field(
+        default="https://playtomic.io/api/v3", alias="PLAYTOMIC_AUTH_URL"
+    )
+
+    # Scan configuration
+    scan_offset_days: int = Field(default=2, ge=0, alias="PLAYTOMIC_SCAN_OFFSET_DAYS")
+    scan_horizon_days: int = Field(default=7, ge=1, alias="PLAYTOMIC_SCAN_HORIZON_DAYS")
+    scan_mode: Literal["day", "range"] = Field(
+        default="day", alias="PLAYTOMIC_SCAN_MODE"
+    )
+    scan_window_days: int = Field(default=7, ge=1, alias="PLAYTOMIC_SCAN_WINDOW_DAYS")
+    scan_max_entries: int = Field(default=200, ge=1, alias="PLAYTOMIC_SCAN_MAX_ENTRIES")
+
+    # Rate limit configuration (requests per second, 0 disables it)
+    rate_limit: float = Field(default=5, ge=0, alias="PLAYTOMIC_RATE_LIMIT")
+    rate_burst: int = Field(default=10, ge=1, alias="PLAYTOMIC_RATE_BURST")
+    rate_reserved: int = Field(default=2, ge=0, alias="PLAYTOMIC_RATE_RESERVED")
+
     # Constants
     tenants: List[Dict] = [
         {
@@ -28,5 +58,32 @@ class Settings(BaseSettings):
         },
     ]
 
+    @model_validator(mode="after")
+    def validate_rate_reserved(self):
+        """
+        Validate scans can use at least one token of the rate limiter.
+        """
+        if self.rate_limit > 0 and self.rate_reserved >= self.rate_burst:
+            raise ValueError(
+                "PLAYTOMIC_RATE_RESERVED must be lower than PLAYTOMIC_RATE_BURST."
+            )
+
+        return self
+
+
+def describe_errors(err: ValidationError) -> Text:
+    """
+    Describe the validation errors of a model in a single line.
+    """
+    descriptions = []
+    for error in err.errors():
+        location = ".".join(str(loc) for loc in error["loc"])
+        descriptions.append(f"{location}: {error['msg']}" if location else error["msg"])
+
+    return "; ".join(descriptions)
+
 
-settings = Settings()
+try:
+    settings = Settings()
+except ValidationError as err:
+    raise SystemExit(f"Invalid configuration: {describe_errors(err)}") from err
@@ -0,0 +1,316 @@
+# Native imports
+import os
+import json
+import threading
+from pathlib import Path
+from datetime import time
+from typing import Text, Tuple, FrozenSet, Dict, Any, Union, Optional
+
+# 3rd party imports
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_validator,
+    model_validator,
+)
+
+# Project imports
+from playtomic_scheduler.utils import date
+from playtomic_scheduler.utils.price import parse_price
+from .config import settings
+
+
+class ConfigError(ValueError):
+    """
+    Raised when the configuration file cannot be read as JSON.
+    """
+
+
+def _parse_days(value: Any):
+    """
+    Parse the days of the week (1 = Monday) to zero based weekdays.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        value = [value]
+    elif isinstance(value, str):
+        value = [day for day in value.split(",") if day.strip()]
+    elif not isinstance(value, (list, tuple, set, frozenset)):
+        raise ValueError("Days must be provided as numeric days separated by commas.")
+
+    days = set()
+    for day in value:
+        try:
+            day = int(day)
+        except (TypeError, ValueError) as err:
+            raise ValueError(
+                "Days must be provided as numeric days separated by commas."
+            ) from err
+
+        if not 1 <= day <= 7:
+            raise ValueError("Days must be between 1 (Monday) and 7 (Sunday).")
+
+        days.add(day - 1)
+
+    if not days:
+        raise ValueError("At least one day must be provided.")
+
+    return days
+
+
+def _parse_hours(value: Any):
+    """
+    Parse the starting hours to time objects.
+    """
+    if isinstance(value, str):
+        value = [hour.strip() for hour in value.split(",") if hour.strip()]
+    elif not isinstance(value, (list, tuple, set, frozenset)):
+        raise ValueError("Hours must be provided as HH:MM separated by commas.")
+
+    hours = set()
+    for hour in value:
+        if isinstance(hour, time):
+            hours.add(hour)
+            continue
+
+        if not isinstance(hour, str):
+            raise ValueError("Hours must be provided as HH:MM separated by commas.")
+
+        try:
+            hours.add(date.parse_time(hour))
+        except (TypeError, ValueError) as err:
+            raise ValueError(
+                "Hours must be provided as HH:MM separated by commas."
+            ) from err
+
+    if not hours:
+        raise ValueError("At least one hour must be provided.")
+
+    return hours
+
+
+def _validate_duration(value: float):
+    """
+    Validate the duration is made of whole half hours.
+    """
+    if value <= 0 or (value * 60) % 30:
+        raise ValueError("Duration must be a positive multiple of 0.5 hours.")
+
+    return value
+
+
+class Tenant(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="allow")
+
+    id: Text
+    name: Text
+    resources: Dict[Text, Dict[Text, Any]] = {}
+
+    def get_resource_properties(self, resource_id: Text) -> Dict[Text, Any]:
+        """
+        Get the configured properties of a court (e.g. type, size).
+        """
+        return self.resources.get(resource_id, {})
+
+
+class WatchRule(BaseModel):
+    """
+    Slots to watch for. Criteria left empty match every slot.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    name: Text
+    days: Optional[FrozenSet[int]] = None
+    hours: Optional[FrozenSet[time]] = None
+    duration: Optional[float] = None
+    max_price: Optional[float] = None
+    tenants: Optional[FrozenSet[Text]] = None
+
+    @field_validator("days", mode="before")
+    @classmethod
+    def parse_days(cls, value: Any):
+        """
+        Parse the days of the week (1 = Monday) to zero based weekdays.
+        """
+        return None if value is None else _parse_days(value)
+
+    @field_validator("hours", mode="before")
+    @classmethod
+    def parse_hours(cls, value: Any):
+        """
+        Parse the starting hours to time objects.
+        """
+        return None if value is None else _parse_hours(value)
+
+    @field_validator("duration")
+    @classmethod
+    def validate_duration(cls, value: Optional[float]):
+        """
+        Validate the duration is made of whole half hours.
+        """
+        return None if value is None else _validate_duration(value)
+
+    def matches(self, slot: Dict) -> bool:
+        """
+        Check if the slot matches the rule.
+        """
+        start_date = slot["start_date"]
+        if self.tenants is not None and slot["tenant_id"] not in self.tenants:
+            return False
+        if self.days is not None and start_date.weekday() not in self.days:
+            return False
+        if self.hours is not None and start_date.time() not in self.hours:
+            return False
+        if self.duration is not None and slot["duration"] != self.duration * 60:
+            return False
+        if self.max_price is not None:
+            price = parse_price(slot.get("price"))
+            if price is None or price > self.max_price:
+                return False
+
+        return True
+
+
+class Profile(BaseModel):
+    """
+    Validated reservation preferences of an account. Days and hours are
+    parsed once into immutable lookup structures.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    email: Text
+    password: Text = Field(repr=False)
+    days: FrozenSet[int]
+    hours: FrozenSet[time]
+    duration: float
+    reservations_per_week: int = Field(default=1, ge=1)
+    max_price: Optional[float] = Field(default=None, ge=0)
+    preferred_resources: Tuple[Text, ...] = ()
+    court_properties: Dict[Text, Any] = {}
+    tenants: Tuple[Tenant, ...] = Field(
+        default_factory=lambda: tuple(Tenant(**tenant) for tenant in settings.tenants)
+    )
+    watches: Tuple[WatchRule, ...] = ()
+
+    @field_validator("days", mode="before")
+    @classmethod
+    def parse_days(cls, value: Any):
+        """
+        Parse the days of the week (1 = Monday) to zero based weekdays.
+        """
+        return _parse_days(value)
+
+    @field_validator("hours", mode="before")
+    @classmethod
+    def parse_hours(cls, value: Any):
+        """
+        Parse the starting hours to time objects.
+        """
+        return _parse_hours(value)
+
+    @field_validator("duration")
+    @classmethod
+    def validate_duration(cls, value: float):
+        """
+        Validate the duration is made of whole half hours.
+        """
+        return _validate_duration(value)
+
+    @field_validator("preferred_resources", mode="before")
+    @classmethod
+    def parse_preferred_resources(cls, value: Any):
+        """
+        Parse the preferred resources from a comma separated string.
+        """
+        if isinstance(value, str):
+            value = [resource.strip() for resource in value.split(",")]
+
+        return tuple(resource for resource in value if resource)
+
+    @model_validator(mode="after")
+    def validate_watch_tenants(self):
+        """
+        Validate the watch rules only list tenants of the profile, as no
+        other tenant is scanned.
+        """
+        tenant_ids = {tenant.id for tenant in self.tenants}
+        for watch in self.watches:
+            unknown = sorted((watch.tenants or set()) - tenant_ids)
+            if unknown:
+                raise ValueError(
+                    f"Watch {watch.name} lists tenants not configured in the "
+                    f"profile: {', '.join(unknown)}."
+                )
+
+        return self
+
+    @property
+    def duration_minutes(self) -> int:
+        """
+        Duration of the reservation in minutes.
+        """
+        return int(self.duration * 60)
+
+    def get_watches(self) -> Tuple[WatchRule, ...]:
+        """
+        Get the watch rules, defaulting to the reservation preferences.
+        """
+        if self.watches:
+            return self.watches
+
+        # Rules parse days as configured (1 = Monday), not zero based
+        return (
+            WatchRule(
+                name="preferences",
+                days=[day + 1 for day in sorted(self.days)],
+                hours=self.hours,
+                duration=self.duration,
+                tenants=frozenset(tenant.id for tenant in self.tenants),
+            ),
+        )
+
+
+# Cache of loaded profiles keyed on path and overrides
+_cache: Dict[Tuple, Tuple[int, Profile]] = {}
+_cache_lock = threading.Lock()
+
+
+def load_profile(path: Union[Text, Path], **overrides) -> Profile:
+    """
+    Load and validate the profile stored in the configuration file. The
+    result is cached until the file modification time changes.
+
+    Arguments
+        path: Path to the configuration file.
+        overrides: Values that take precedence over the file (None is ignored).
+
+    Returns
+        The validated profile. Raises ConfigError when the file is not valid
+        JSON and pydantic.ValidationError on bad input.
+    """
+    overrides = {key: value for key, value in overrides.items() if value is not None}
+    cache_key = (str(path), tuple(sorted(overrides.items())))
+    mtime = os.stat(path).st_mtime_ns
+
+    with _cache_lock:
+        cached = _cache.get(cache_key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+    with open(path, "r") as config_file:
+        try:
+            config = json.load(config_file)
+        except json.JSONDecodeError as err:
+            raise ConfigError(f"{path} is not valid JSON ({err})") from err
+
+    if not isinstance(config, dict):
+        raise ConfigError(f"{path} must contain a JSON object")
+
+    profile = Profile.model_validate({**config, **overrides})
+
+    with _cache_lock:
+        _cache[cache_key] = (mtime, profile)
+
+    return profile
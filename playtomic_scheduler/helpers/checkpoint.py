@@ -0,0 +1,153 @@
+# Native imports
+import time
+import uuid
+import sqlite3
+import logging
+from pathlib import Path
+from contextlib import closing
+from typing import List, Text, Optional, Union
+from typing_extensions import TypedDict
+
+# Project imports
+from playtomic_scheduler.utils import directory
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+# Constants
+CHECKPOINT_FILE_NAME = "checkpoints.db"
+STARTED = "started"
+CREATED = "created"
+UPDATED = "updated"
+CONFIRMED = "confirmed"
+ABORTED = "aborted"
+
+
+class Booking(TypedDict):
+    id: Text
+    account: Text
+    tenant_id: Text
+    resource_id: Text
+    start_date: Text
+    payment_intent_id: Optional[Text]
+    step: Text
+    updated_at: float
+
+
+class CheckpointStore:
+    """
+    SQLite backed write-ahead log of the booking steps and of the last
+    completed check of each account. Every step is committed before the
+    next request is sent, so a crashed process leaves enough behind to
+    reconcile its booking on the next start.
+    """
+
+    path: Path
+
+    def __init__(self, path: Optional[Union[Text, Path]] = None):
+        self.path = Path(path) if path else directory.setup_dir() / CHECKPOINT_FILE_NAME
+        with closing(self.__connect()) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS bookings ("
+                "id TEXT PRIMARY KEY, account TEXT NOT NULL, tenant_id TEXT NOT NULL, "
+                "resource_id TEXT NOT NULL, start_date TEXT NOT NULL, "
+                "payment_intent_id TEXT, step TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS checks ("
+                "account TEXT PRIMARY KEY, checked_at REAL NOT NULL)"
+            )
+
+    def __connect(self):
+        """
+        Open a connection in autocommit mode so every write is durable.
+        """
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def begin(
+        self, account: Text, tenant_id: Text, resource_id: Text, start_date: Text
+    ) -> Text:
+        """
+        Record a booking about to be started and return its identifier.
+
+        Arguments
+            start_date: UTC start of the court, as sent to the API.
+        """
+        booking_id = uuid.uuid4().hex
+        with closing(self.__connect()) as conn:
+            conn.execute(
+                "INSERT INTO bookings (id, account, tenant_id, resource_id, "
+                "start_date, payment_intent_id, step, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, NULL, ?, ?)",
+                (
+                    booking_id,
+                    account,
+                    tenant_id,
+                    resource_id,
+                    start_date,
+                    STARTED,
+                    time.time(),
+                ),
+            )
+
+        return booking_id
+
+    def advance(
+        self, booking_id: Text, step: Text, payment_intent_id: Optional[Text] = None
+    ):
+        """
+        Record the step reached by a booking.
+        """
+        with closing(self.__connect()) as conn:
+            conn.execute(
+                "UPDATE bookings SET step = ?, updated_at = ?, "
+                "payment_intent_id = COALESCE(?, payment_intent_id) WHERE id = ?",
+                (step, time.time(), payment_intent_id, booking_id),
+            )
+
+    def get_pending(self, account: Text) -> List[Booking]:
+        """
+        Get the bookings of the account that were neither confirmed nor
+        aborted, oldest first.
+        """
+        with closing(self.__connect()) as conn:
+            rows = conn.execute(
+                "SELECT * FROM bookings WHERE account = ? AND step NOT IN (?, ?) "
+                "ORDER BY updated_at",
+                (account, CONFIRMED, ABORTED),
+            ).fetchall()
+
+        return [Booking(**dict(row)) for row in rows]
+
+    def get(self, booking_id: Text) -> Optional[Booking]:
+        """
+        Get the current state of a booking.
+        """
+        with closing(self.__connect()) as conn:
+            row = conn.execute(
+                "SELECT * FROM bookings WHERE id = ?", (booking_id,)
+            ).fetchone()
+
+        return Booking(**dict(row)) if row else None
+
+    def set_checked(self, account: Text):
+        """
+        Record that a full check of the account was completed now.
+        """
+        with closing(self.__connect()) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checks (account, checked_at) VALUES (?, ?)",
+                (account, time.time()),
+            )
+
+    def get_checked(self, account: Text) -> Optional[float]:
+        """
+        Get the epoch time of the last completed check of the account.
+        """
+        with closing(self.__connect()) as conn:
+            row = conn.execute(
+                "SELECT checked_at FROM checks WHERE account = ?", (account,)
+            ).fetchone()
+
+        return row["checked_at"] if row else None
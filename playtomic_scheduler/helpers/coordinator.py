@@ -0,0 +1,190 @@
+# Native imports
+import zlib
+import signal
+import logging
+from datetime import datetime
+from typing import List, Text, Optional, Tuple, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing_extensions import TypedDict
+
+# Project imports
+from playtomic_scheduler.config import Profile, Tenant
+from .lease import LeaseStore
+from .checkpoint import CheckpointStore
+from .reserver import Reserver
+from .playtomic import Playtomic
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+
+class ScanTask(TypedDict):
+    tenant: Tenant
+    start_date: Text
+    end_date: Text
+
+
+# Reserver owned by the current worker process
+_reserver: Optional[Reserver] = None
+
+
+def partition(
+    tenants: Iterable[Tenant],
+    scan_windows: List[Tuple[datetime, datetime]],
+    shard_index: int = 0,
+    shard_count: int = 1,
+) -> List[ScanTask]:
+    """
+    Split the scan work in (tenant, window) tasks and keep the ones that
+    belong to the given shard. The assignment is stable across hosts.
+    """
+    tasks = []
+    for tenant in tenants:
+        for start_date, end_date in scan_windows:
+            task_key = f"{tenant.id}:{start_date.date().isoformat()}".encode()
+            if zlib.crc32(task_key) % shard_count != shard_index:
+                continue
+
+            tasks.append(
+                ScanTask(
+                    tenant=tenant,
+                    start_date=start_date.isoformat(),
+                    end_date=end_date.isoformat(),
+                )
+            )
+
+    return tasks
+
+
+def _init_worker(
+    profile: Profile,
+    lease_path: Text,
+    horizon_days: int,
+    scan_mode: Text,
+    checkpoint_path: Optional[Text] = None,
+    access_token: Optional[Text] = None,
+    user_id: Optional[Text] = None,
+):
+    """
+    Setup the reserver of the worker process. Workers reuse the login of
+    the coordinator, so they do not spend booking tokens of the rate limiter
+    on logins, and only login themselves without one.
+    """
+    global _reserver  # pylint: disable=W0603
+
+    # Interrupts are handled by the coordinator, which lets the running
+    # tasks (and their bookings) finish before shutting the pool down. Both
+    # signals are ignored as they may be sent to the whole process group.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+    playtomic = Playtomic(profile.email, profile.password)
+    if access_token:
+        playtomic.authenticate(access_token, user_id)
+    else:
+        playtomic.login()
+
+    _reserver = Reserver(
+        playtomic,
+        profile,
+        lease=LeaseStore(lease_path),
+        horizon_days=horizon_days,
+        scan_mode=scan_mode,
+        checkpoint=CheckpointStore(checkpoint_path) if checkpoint_path else None,
+    )
+
+
+def _run_task(task: ScanTask) -> bool:
+    """
+    Scan a single (tenant, window) task in the worker process.
+    """
+    _reserver.process_window(
+        task["tenant"],
+        datetime.fromisoformat(task["start_date"]),
+        datetime.fromisoformat(task["end_date"]),
+    )
+    return _reserver.reservation_confirmed
+
+
+class Coordinator:
+    """
+    Partition the scan of every tenant across a pool of worker processes.
+    Bookings are serialized through the lease store so the weekly limit of
+    the account is never exceeded, even with several coordinators running.
+    """
+
+    reserver: Reserver
+    workers: int
+    shard_index: int
+    shard_count: int
+
+    def __init__(
+        self,
+        reserver: Reserver,
+        workers: int,
+        shard_index: int = 0,
+        shard_count: int = 1,
+    ):
+        if not reserver.lease:
+            raise ValueError("A lease store is required to coordinate workers.")
+
+        self.reserver = reserver
+        self.workers = workers
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+
+    def run(self, tenants: Iterable[Tenant]) -> bool:
+        """
+        Run the scan of the tenants and return whether a reservation was
+        confirmed by any of the workers.
+        """
+        reserver = self.reserver
+        tasks = partition(
+            tenants,
+            reserver.get_scan_windows(reserver.get_scan_dates()),
+            self.shard_index,
+            self.shard_count,
+        )
+        logger.info(
+            "Dispatching %s scan tasks to %s workers...", len(tasks), self.workers
+        )
+
+        initargs = (
+            reserver.profile,
+            str(reserver.lease.path),
+            reserver.horizon_days,
+            reserver.scan_mode,
+            str(reserver.checkpoint.path) if reserver.checkpoint else None,
+            reserver.playtomic.access_token,
+            reserver.playtomic.user_id,
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=initargs,
+        ) as executor:
+            futures = {executor.submit(_run_task, task): task for task in tasks}
+
+            for future in as_completed(futures):
+                task = futures[future]
+                if future.cancelled():
+                    continue
+
+                try:
+                    confirmed = future.result()
+                except Exception:  # pylint: disable=W0703
+                    logger.exception(
+                        "Scan failed for %s at %s",
+                        task["tenant"].name,
+                        task["start_date"],
+                    )
+                    continue
+
+                if confirmed and not reserver.reservation_confirmed:
+                    reserver.reservation_confirmed = True
+
+                if reserver.reservation_confirmed or reserver.stopping:
+                    for pending in futures:
+                        pending.cancel()
+
+        return reserver.reservation_confirmed
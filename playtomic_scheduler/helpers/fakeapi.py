@@ -0,0 +1,306 @@
+# Native imports
+import time
+import uuid
+import zlib
+import random
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Text
+
+# 3rd party imports
+from flask import Flask, jsonify, request
+from waitress import serve as waitress_serve
+
+# Project imports
+from playtomic_scheduler.config import Tenant
+
+# Constants
+OPENING_HOUR = 8
+CLOSING_HOUR = 22
+DURATIONS = (60, 90, 120)
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def build_catalogue(tenant_count: int, court_count: int, seed: int = 0) -> List[Tenant]:
+    """
+    Build a synthetic catalogue of tenants and courts. The same arguments
+    always build the same catalogue, so agents and the fake API agree.
+    """
+    rng = random.Random(seed)
+    tenants = []
+    for tenant_index in range(tenant_count):
+        resources = {
+            f"loadtest-court-{tenant_index}-{court_index}": {
+                "name": f"Court {court_index + 1}",
+                "indoor": rng.random() < 0.5,
+                "surface": rng.choice(["crystal", "wall"]),
+            }
+            for court_index in range(court_count)
+        }
+        tenants.append(
+            Tenant(
+                id=f"loadtest-tenant-{tenant_index}",
+                name=f"LOADTEST CLUB {tenant_index + 1}",
+                resources=resources,
+            )
+        )
+
+    return tenants
+
+
+def _is_taken(key: Text, occupancy: float) -> bool:
+    """
+    Check if a slot is taken by players outside of the load test. The
+    result is stable for the slot, so every agent sees the same courts.
+    """
+    return zlib.crc32(key.encode()) % 1000 < occupancy * 1000
+
+
+class FakeApi:
+    """
+    In-memory stand-in of the Playtomic API. Courts are booked for real, so
+    concurrent agents going for the same slot conflict like they would on
+    the live API, and every conflict is counted.
+    """
+
+    tenants: Dict[Text, Tenant]
+    latency: float
+    occupancy: float
+
+    def __init__(self, tenants: List[Tenant], latency: float = 0, occupancy=0.5):
+        self.tenants = {tenant.id: tenant for tenant in tenants}
+        self.latency = latency
+        self.occupancy = occupancy
+        self.__lock = threading.Lock()
+        self.__tokens: Dict[Text, Text] = {}
+        self.__intents: Dict[Text, Dict] = {}
+        self.__booked: Dict[Text, Text] = {}
+        self.__bookings: List[Dict] = []
+        self.__requests: Dict[Text, int] = {}
+        self.__conflicts = 0
+
+    def __enter(self, endpoint: Text):
+        """
+        Count the request and simulate the API latency.
+        """
+        with self.__lock:
+            self.__requests[endpoint] = self.__requests.get(endpoint, 0) + 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+    def __get_account(self) -> Text:
+        """
+        Get the account of the request from its access token.
+        """
+        token = request.headers.get("Authorization", "").replace("Bearer ", "")
+        return self.__tokens.get(token, "anonymous")
+
+    def login(self):
+        """
+        Login the account of the request and issue an access token.
+        """
+        self.__enter("login")
+        email = (request.get_json(silent=True) or {}).get("email", "anonymous")
+        token = uuid.uuid4().hex
+        with self.__lock:
+            self.__tokens[token] = email
+
+        return jsonify({"access_token": token, "user_id": email})
+
+    def availability(self):
+        """
+        List the free slots of every court of the tenant in the requested days.
+        """
+        self.__enter("availability")
+        tenant = self.tenants.get(request.args.get("tenant_id"))
+        if tenant is None:
+            return jsonify([])
+
+        start_date = datetime.strptime(request.args["local_start_min"], DATE_FORMAT)
+        end_date = datetime.strptime(request.args["local_start_max"], DATE_FORMAT)
+
+        entries = []
+        day = start_date.date()
+        while day <= end_date.date():
+            for resource_id in tenant.resources:
+                entries.append(
+                    {
+                        "resource_id": resource_id,
+                        "start_date": day.isoformat(),
+                        "slots": self.__get_slots(resource_id, day.isoformat()),
+                    }
+                )
+            day += timedelta(days=1)
+
+        return jsonify(entries)
+
+    def __get_slots(self, resource_id: Text, day: Text) -> List[Dict]:
+        """
+        Get the free slots of a court day.
+        """
+        slots = []
+        for half_hour in range(OPENING_HOUR * 2, CLOSING_HOUR * 2):
+            start_time = f"{half_hour // 2:02d}:{half_hour % 2 * 30:02d}:00"
+            key = f"{resource_id}:{day}T{start_time}"
+            if key in self.__booked or _is_taken(key, self.occupancy):
+                continue
+
+            for duration in DURATIONS:
+                price = 16 + zlib.crc32(f"{key}:{duration}".encode()) % 24
+                slots.append(
+                    {
+                        "start_time": start_time,
+                        "duration": duration,
+                        "price": f"{price} EUR",
+                    }
+                )
+
+        return slots
+
+    def create_payment_intent(self):
+        """
+        Create a payment intent for a court, unless it is already booked.
+        """
+        self.__enter("create_payment_intent")
+        data = request.get_json(silent=True) or {}
+        item = data["cart"]["requested_item"]["cart_item_data"]
+        key = f"{item['resource_id']}:{item['start']}"
+
+        with self.__lock:
+            if key in self.__booked:
+                self.__conflicts += 1
+                return jsonify({"message": "Slot already booked"}), 409
+
+            payment_intent_id = uuid.uuid4().hex
+            self.__intents[payment_intent_id] = {
+                "key": key,
+                "account": self.__get_account(),
+                "tenant_id": item["tenant_id"],
+                "resource_id": item["resource_id"],
+                "start_date": item["start"],
+            }
+
+        return jsonify(
+            {
+                "payment_intent_id": payment_intent_id,
+                "available_payment_methods": [
+                    {"name": "Pay at the club", "payment_method_id": "club"}
+                ],
+            }
+        )
+
+    def update_payment_intent(self, payment_intent_id: Text):
+        """
+        Select the payment method of a payment intent.
+        """
+        self.__enter("update_payment_intent")
+        if payment_intent_id not in self.__intents:
+            return jsonify({"message": "Payment intent not found"}), 404
+
+        return jsonify({"payment_intent_id": payment_intent_id})
+
+    def confirm_reservation(self, payment_intent_id: Text):
+        """
+        Book the court of a payment intent, unless it was booked meanwhile.
+        """
+        self.__enter("confirm_reservation")
+        with self.__lock:
+            intent = self.__intents.pop(payment_intent_id, None)
+            if intent is None:
+                return jsonify({"message": "Payment intent not found"}), 404
+
+            if intent["key"] in self.__booked:
+                self.__conflicts += 1
+                return jsonify({"message": "Slot already booked"}), 409
+
+            self.__booked[intent["key"]] = intent["account"]
+            self.__bookings.append(
+                {
+                    "match_id": payment_intent_id,
+                    "account": intent["account"],
+                    "tenant_id": intent["tenant_id"],
+                    "resource_id": intent["resource_id"],
+                    "start_date": intent["start_date"],
+                    "status": "PENDING",
+                }
+            )
+
+        return jsonify({"status": "CONFIRMED"})
+
+    def matches(self):
+        """
+        List the matches of the account, latest first.
+        """
+        self.__enter("matches")
+        account = request.args.get("owner_id") or self.__get_account()
+        size = int(request.args.get("size", 10))
+        with self.__lock:
+            matches = [
+                booking for booking in self.__bookings if booking["account"] == account
+            ]
+
+        matches.sort(key=lambda match: match["start_date"], reverse=True)
+        return jsonify(matches[:size])
+
+    def stats(self):
+        """
+        Get the requests, conflicts and bookings served so far.
+        """
+        with self.__lock:
+            return jsonify(
+                {
+                    "requests": dict(self.__requests),
+                    "conflicts": self.__conflicts,
+                    "bookings": list(self.__bookings),
+                }
+            )
+
+
+def create_fake_app(api: FakeApi) -> Flask:
+    """
+    Create the Flask application serving the fake API under the same paths
+    as Playtomic (/api/v1 and /api/v3), plus its stats at /api/loadtest/stats.
+    """
+    app = Flask(__name__)
+    app.add_url_rule("/api/v3/auth/login", "login", api.login, methods=["POST"])
+    app.add_url_rule("/api/v1/availability", "availability", api.availability)
+    app.add_url_rule(
+        "/api/v1/payment_intents",
+        "create_payment_intent",
+        api.create_payment_intent,
+        methods=["POST"],
+    )
+    app.add_url_rule(
+        "/api/v1/payment_intents/<payment_intent_id>",
+        "update_payment_intent",
+        api.update_payment_intent,
+        methods=["PATCH"],
+    )
+    app.add_url_rule(
+        "/api/v1/payment_intents/<payment_intent_id>/confirmation",
+        "confirm_reservation",
+        api.confirm_reservation,
+        methods=["POST"],
+    )
+    app.add_url_rule("/api/v1/matches", "matches", api.matches)
+    app.add_url_rule("/api/loadtest/stats", "stats", api.stats)
+
+    return app
+
+
+def serve_fake_api(
+    host: Text,
+    port: int,
+    threads: int,
+    tenant_count: int,
+    court_count: int,
+    seed: int = 0,
+    latency: float = 0,
+    occupancy: float = 0.5,
+):
+    """
+    Serve the fake API for the synthetic catalogue (blocking).
+    """
+    api = FakeApi(build_catalogue(tenant_count, court_count, seed), latency, occupancy)
+    waitress_serve(create_fake_app(api), host=host, port=port, threads=threads)
@@ -0,0 +1,104 @@
+# Native imports
+import os
+import time
+import uuid
+import socket
+import sqlite3
+import logging
+from pathlib import Path
+from contextlib import closing, contextmanager
+from typing import Text, Optional, Union
+
+# Project imports
+from playtomic_scheduler.utils import directory
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+# Constants
+LEASE_FILE_NAME = "leases.db"
+DEFAULT_LEASE_TTL = 120
+POLL_INTERVAL = 0.2
+
+
+class LeaseStore:
+    """
+    SQLite backed lease table shared by every process (and every host
+    mounting the same directory) that works on the same configuration.
+    """
+
+    path: Path
+    owner: Text
+
+    def __init__(self, path: Optional[Union[Text, Path]] = None):
+        self.path = Path(path) if path else directory.setup_dir() / LEASE_FILE_NAME
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        with closing(self.__connect()) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                "key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def __connect(self):
+        """
+        Open a connection in autocommit mode so transactions are explicit.
+        """
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def acquire(self, key: Text, ttl: float = DEFAULT_LEASE_TTL) -> bool:
+        """
+        Try to acquire the lease for the given key. Expired leases are
+        taken over, leases already held by this owner are renewed.
+        """
+        now = time.time()
+        conn = self.__connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "DELETE FROM leases WHERE key = ? AND (expires_at < ? OR owner = ?)",
+                (key, now, self.owner),
+            )
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO leases (key, owner, expires_at) VALUES (?, ?, ?)",
+                (key, self.owner, now + ttl),
+            )
+            conn.execute("COMMIT")
+            return cursor.rowcount == 1
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def release(self, key: Text):
+        """
+        Release the lease for the given key if it is held by this owner.
+        """
+        with closing(self.__connect()) as conn:
+            conn.execute(
+                "DELETE FROM leases WHERE key = ? AND owner = ?", (key, self.owner)
+            )
+
+    @contextmanager
+    def hold(self, key: Text, ttl: float = DEFAULT_LEASE_TTL, wait: float = 0):
+        """
+        Hold the lease for the given key for the duration of the block.
+
+        Arguments
+            key: Lease identifier.
+            ttl: Seconds after which the lease can be taken over (crashed owner).
+            wait: Seconds to keep retrying before giving up.
+
+        Returns
+            True if the lease was acquired, False otherwise.
+        """
+        deadline = time.monotonic() + wait
+        acquired = self.acquire(key, ttl)
+        while not acquired and time.monotonic() < deadline:
+            time.sleep(POLL_INTERVAL)
+            acquired = self.acquire(key, ttl)
+
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self.release(key)
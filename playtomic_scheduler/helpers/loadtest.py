@@ -0,0 +1,321 @@
+# Native imports
+import time
+import random
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime
+from collections import Counter
+from typing import Dict, List, Text, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing_extensions import TypedDict
+
+# 3rd party imports
+import requests
+import numpy as np
+from requests.exceptions import RequestException
+
+# Project imports
+from playtomic_scheduler.config import Profile, Tenant
+from playtomic_scheduler.utils import date
+from .lease import LeaseStore
+from .checkpoint import CheckpointStore
+from .reserver import Reserver
+from .playtomic import Playtomic
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+
+class LoadTestReport(TypedDict):
+    agents: int
+    rounds: int
+    elapsed: float
+    scans: int
+    scans_per_second: float
+    requests: Optional[int]
+    requests_per_second: Optional[float]
+    booking_attempts: int
+    bookings: int
+    conflicts: Optional[int]
+    over_quota: Optional[int]
+    errors: int
+    scan_p50: Optional[float]
+    scan_p99: Optional[float]
+    booking_p50: Optional[float]
+    booking_p99: Optional[float]
+
+
+def build_profiles(
+    agent_count: int, tenants: List[Tenant], seed: int = 0
+) -> List[Profile]:
+    """
+    Build synthetic preferences for the agents, each one with its own
+    account and a random share of the catalogue.
+    """
+    rng = random.Random(seed)
+    profiles = []
+    for index in range(agent_count):
+        hours = sorted(
+            rng.sample(
+                [
+                    f"{hour:02d}:{minute:02d}"
+                    for hour in range(8, 21)
+                    for minute in (0, 30)
+                ],
+                rng.randint(2, 6),
+            )
+        )
+        profiles.append(
+            Profile(
+                email=f"agent-{index}@loadtest.local",
+                password="loadtest",
+                days=",".join(
+                    str(day)
+                    for day in sorted(rng.sample(range(1, 8), rng.randint(2, 5)))
+                ),
+                hours=",".join(hours),
+                duration=rng.choice([1, 1.5, 2]),
+                reservations_per_week=rng.randint(1, 2),
+                max_price=rng.choice([None, 30, 35]),
+                court_properties=rng.choice([{}, {}, {"indoor": True}]),
+                tenants=rng.sample(tenants, rng.randint(1, min(3, len(tenants)))),
+            )
+        )
+
+    return profiles
+
+
+def get_percentile(samples: List[float], percentile: float) -> Optional[float]:
+    """
+    Get the percentile of the samples (None when there are no samples).
+    """
+    if not samples:
+        return None
+
+    return float(np.percentile(samples, percentile))
+
+
+def count_over_quota(bookings: List[Dict], profiles: List[Profile]) -> int:
+    """
+    Count the bookings made beyond the weekly limit of their account.
+    """
+    limits = {profile.email: profile.reservations_per_week for profile in profiles}
+    if not bookings:
+        return 0
+
+    local_dates, _ = date.parse_utc_to_local_array(
+        [booking["start_date"] for booking in bookings]
+    )
+    week_counts = Counter(
+        zip(
+            [booking["account"] for booking in bookings],
+            date.get_week_key_array(local_dates).tolist(),
+        )
+    )
+    return sum(
+        max(0, count - limits.get(account, count))
+        for (account, _), count in week_counts.items()
+    )
+
+
+class TimedReserver(Reserver):
+    """
+    Reserver recording the latency of every scanned window and booking.
+    Scan latencies exclude the time spent booking inside the window, and
+    only the calls that reach the payment intent requests count as bookings.
+    """
+
+    scan_latencies: List[float]
+    booking_latencies: List[float]
+    bookings: int
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scan_latencies = []
+        self.booking_latencies = []
+        self.bookings = 0
+        self.__booking_time = 0.0
+        self.__booking_started = False
+
+    def process_window(self, tenant: Tenant, start_date: datetime, end_date: datetime):
+        """
+        Process a window of days of the tenant, timing its scan.
+        """
+        started_at = time.perf_counter()
+        booking_time = self.__booking_time
+
+        super().process_window(tenant, start_date, end_date)
+
+        elapsed = time.perf_counter() - started_at
+        self.scan_latencies.append(elapsed - (self.__booking_time - booking_time))
+
+    def reserve_court(self, tenant_id: Text, resource_id: Text, start_date: datetime):
+        """
+        Reserve the court, timing the booking.
+        """
+        was_confirmed = self.reservation_confirmed
+        self.__booking_started = False
+        started_at = time.perf_counter()
+
+        super().reserve_court(tenant_id, resource_id, start_date)
+
+        elapsed = time.perf_counter() - started_at
+        self.__booking_time += elapsed
+
+        # Skipped by the lease or the weekly limit before booking
+        if not self.__booking_started:
+            return
+
+        self.booking_latencies.append(elapsed)
+        if not was_confirmed and self.reservation_confirmed:
+            self.bookings += 1
+
+    def book_court(self, tenant_id: Text, resource_id: Text, start_date: datetime):
+        """
+        Book the court, flagging the reservation as a booking attempt.
+        """
+        self.__booking_started = True
+        super().book_court(tenant_id, resource_id, start_date)
+
+
+class LoadTest:
+    """
+    Run simulated booking agents concurrently, one thread and one API client
+    per agent, against a Playtomic stand-in. Agents share the lease and
+    checkpoint stores like the processes of a real deployment, but skip the
+    rate limiter so the stand-in is the only bottleneck.
+    """
+
+    profiles: List[Profile]
+    api_url: Text
+    auth_url: Text
+    stats_url: Optional[Text]
+    rounds: int
+    horizon_days: Optional[int]
+
+    def __init__(
+        self,
+        profiles: List[Profile],
+        api_url: Text,
+        auth_url: Text,
+        state_path: Path,
+        stats_url: Optional[Text] = None,
+        rounds: int = 1,
+        horizon_days: Optional[int] = None,
+    ):
+        self.profiles = profiles
+        self.api_url = api_url
+        self.auth_url = auth_url
+        self.stats_url = stats_url
+        self.rounds = rounds
+        self.horizon_days = horizon_days
+        self.__lease = LeaseStore(state_path / "leases.db")
+        self.__checkpoint = CheckpointStore(state_path / "checkpoints.db")
+        self.__errors = 0
+        self.__errors_lock = threading.Lock()
+
+    def __build_reserver(self, profile: Profile) -> TimedReserver:
+        """
+        Setup the reserver of an agent.
+        """
+        playtomic = Playtomic(
+            profile.email,
+            profile.password,
+            api_url=self.api_url,
+            auth_url=self.auth_url,
+            limiter=False,
+        )
+
+        return TimedReserver(
+            playtomic,
+            profile,
+            lease=self.__lease,
+            horizon_days=self.horizon_days,
+            checkpoint=self.__checkpoint,
+        )
+
+    def __run_agent(self, reserver: TimedReserver):
+        """
+        Run the rounds of an agent, each one a full check of its tenants.
+        """
+        for _ in range(self.rounds):
+            reserver.reservation_confirmed = False
+            for tenant in reserver.profile.tenants:
+                try:
+                    reserver.process_tenant(tenant)
+                except RequestException:
+                    with self.__errors_lock:
+                        self.__errors += 1
+
+    def __get_stats(self) -> Optional[Dict]:
+        """
+        Get the server side stats of the stand-in, if it exposes them.
+        """
+        if not self.stats_url:
+            return None
+
+        try:
+            response = requests.get(self.stats_url, timeout=5)
+            response.raise_for_status()
+            return response.json()
+        except (RequestException, ValueError):
+            logger.info("Could not get the stats of the API stand-in.")
+            return None
+
+    def run(self) -> LoadTestReport:
+        """
+        Run every agent to completion and report the metrics. Requests,
+        conflicts and over quota bookings are only known when the stand-in
+        exposes its stats.
+        """
+        reservers = [self.__build_reserver(profile) for profile in self.profiles]
+        for reserver in reservers:
+            reserver.playtomic.login()
+
+        stats_before = self.__get_stats()
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(reservers)) as executor:
+            list(executor.map(self.__run_agent, reservers))
+        elapsed = time.perf_counter() - started_at
+        stats_after = self.__get_stats()
+
+        scan_latencies = [
+            latency for reserver in reservers for latency in reserver.scan_latencies
+        ]
+        booking_latencies = [
+            latency for reserver in reservers for latency in reserver.booking_latencies
+        ]
+
+        # Only count the server activity of this run
+        request_count = conflicts = over_quota = None
+        if stats_before is not None and stats_after is not None:
+            request_count = sum(stats_after["requests"].values()) - sum(
+                stats_before["requests"].values()
+            )
+            conflicts = stats_after["conflicts"] - stats_before["conflicts"]
+            over_quota = count_over_quota(
+                stats_after["bookings"], self.profiles
+            ) - count_over_quota(stats_before["bookings"], self.profiles)
+
+        return LoadTestReport(
+            agents=len(reservers),
+            rounds=self.rounds,
+            elapsed=elapsed,
+            scans=len(scan_latencies),
+            scans_per_second=len(scan_latencies) / elapsed if elapsed else 0,
+            requests=request_count,
+            requests_per_second=(
+                request_count / elapsed
+                if request_count is not None and elapsed
+                else None
+            ),
+            booking_attempts=len(booking_latencies),
+            bookings=sum(reserver.bookings for reserver in reservers),
+            conflicts=conflicts,
+            over_quota=over_quota,
+            errors=self.__errors,
+            scan_p50=get_percentile(scan_latencies, 50),
+            scan_p99=get_percentile(scan_latencies, 99),
+            booking_p50=get_percentile(booking_latencies, 50),
+            booking_p99=get_percentile(booking_latencies, 99),
+        )
@@ -0,0 +1,125 @@
+# Native imports
+import sys
+import json
+import socket
+import logging
+from typing import Text, Dict, List, Optional
+
+# 3rd party imports
+import requests
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+# Constants
+UNIX_PREFIX = "unix:"
+
+
+class StdoutSink:
+    """
+    Write events to the standard output as JSON lines.
+    """
+
+    def send(self, event: Dict):
+        """
+        Send the event.
+        """
+        sys.stdout.write(json.dumps(event) + "\n")
+        sys.stdout.flush()
+
+
+class WebhookSink:
+    """
+    POST events as JSON to a webhook URL.
+    """
+
+    url: Text
+    session: requests.Session
+
+    def __init__(self, url: Text):
+        self.url = url
+        self.session = requests.Session()
+
+    def send(self, event: Dict):
+        """
+        Send the event.
+        """
+        try:
+            response = self.session.post(self.url, json=event, timeout=5)
+            response.raise_for_status()
+        except requests.RequestException as err:
+            logger.warning("Could not deliver event to %s: %s", self.url, err)
+
+
+class UnixSocketSink:
+    """
+    Stream events as JSON lines to a unix socket, reconnecting on failure.
+    """
+
+    path: Text
+    sock: Optional[socket.socket]
+
+    def __init__(self, path: Text):
+        self.path = path
+        self.sock = None
+
+    def send(self, event: Dict):
+        """
+        Send the event.
+        """
+        line = (json.dumps(event) + "\n").encode()
+        for _ in range(2):
+            try:
+                if self.sock is None:
+                    self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    self.sock.settimeout(5)
+                    self.sock.connect(self.path)
+
+                self.sock.sendall(line)
+                return
+            except OSError as err:
+                self.close()
+                error = err
+
+        logger.warning("Could not deliver event to %s: %s", self.path, error)
+
+    def close(self):
+        """
+        Close the socket connection.
+        """
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+
+def create_sink(target: Text):
+    """
+    Create a sink from its target: `stdout`, an http(s) URL or `unix:<path>`.
+    """
+    if target == "stdout":
+        return StdoutSink()
+
+    if target.startswith(("http://", "https://")):
+        return WebhookSink(target)
+
+    if target.startswith(UNIX_PREFIX):
+        return UnixSocketSink(target[len(UNIX_PREFIX) :])
+
+    raise ValueError(f"Unsupported sink: {target}")
+
+
+class Notifier:
+    """
+    Deliver every event to all of the configured sinks.
+    """
+
+    sinks: List
+
+    def __init__(self, sinks: List):
+        self.sinks = sinks
+
+    def notify(self, event: Dict):
+        """
+        Deliver the event.
+        """
+        for sink in self.sinks:
+            sink.send(event)
@@ -0,0 +1,155 @@
+# Native imports
+import logging
+from datetime import datetime, timedelta
+from typing import List, Dict, Text, Tuple, Iterable, Optional, Callable, AbstractSet
+from concurrent.futures import ThreadPoolExecutor
+
+# 3rd party imports
+from requests.exceptions import RequestException
+
+# Project imports
+from playtomic_scheduler.config import Tenant
+from playtomic_scheduler.utils import date
+from .reserver import Reserver, Slot
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+# Constants
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PLAN_DAYS = 7
+
+
+class Planner:
+    """
+    Compute every bookable slot matching the reserver preferences across a
+    date range without booking anything.
+    """
+
+    reserver: Reserver
+    max_workers: int
+    failed_windows: List[Tuple[Tenant, datetime, datetime]]
+
+    def __init__(self, reserver: Reserver, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.reserver = reserver
+        self.max_workers = max_workers
+        self.failed_windows = []
+
+    @staticmethod
+    def get_default_range(
+        start_date: Optional[datetime] = None,
+    ) -> Tuple[datetime, datetime]:
+        """
+        Get the default range to plan: a week from the start date (defaults
+        to now), both ends inclusive.
+        """
+        start_date = start_date or datetime.now()
+        return start_date, start_date + timedelta(days=DEFAULT_PLAN_DAYS - 1)
+
+    def get_plan_dates(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        days: Optional[AbstractSet[int]] = None,
+    ):
+        """
+        Get the days of the range that fall in the target days, both ends
+        inclusive.
+        """
+        days = self.reserver.days if days is None else days
+
+        plan_dates = []
+        current_date = date.set_start_of_day(start_date)
+        while current_date <= end_date:
+            if current_date.weekday() in days:
+                plan_dates.append(current_date)
+
+            current_date += timedelta(days=1)
+
+        return plan_dates
+
+    def plan(
+        self,
+        tenants: Iterable[Tenant],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[Slot]:
+        """
+        Fetch the availability of every tenant and window concurrently and
+        return the matching slots sorted by start date.
+        """
+        plan_dates = self.get_plan_dates(start_date, end_date)
+        return self.collect(tenants, plan_dates, self.__match_slots)
+
+    def collect(
+        self,
+        tenants: Iterable[Tenant],
+        plan_dates: List[datetime],
+        select: Callable[[Dict, Text], Iterable[Slot]],
+    ) -> List[Slot]:
+        """
+        Fetch the availability of every tenant and window concurrently and
+        return the slots picked by the select callable sorted by start date.
+        Windows that fail are kept in failed_windows, the slots of the other
+        windows are still returned.
+        """
+        tasks = [
+            (tenant, window, select)
+            for tenant in tenants
+            for window in self.reserver.get_scan_windows(plan_dates)
+        ]
+        logger.info("Planning %s tenant windows...", len(tasks))
+
+        # A single worker runs in the calling thread, where profilers see it
+        slots = []
+        self.failed_windows = []
+        if self.max_workers == 1:
+            for task in tasks:
+                slots.extend(self.__collect_window(task))
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for window_slots in executor.map(self.__collect_window, tasks):
+                    slots.extend(window_slots)
+
+        return sorted(
+            slots,
+            key=lambda slot: (
+                slot["start_date"],
+                slot["tenant_id"],
+                slot["resource_id"],
+            ),
+        )
+
+    def __collect_window(self, task: Tuple) -> List[Slot]:
+        """
+        Fetch and select the slots of a single tenant window. A failed window
+        is logged and recorded instead of failing the whole collection.
+        """
+        tenant, (window_start, window_end), select = task
+        try:
+            availability_entries = self.reserver.fetch_window(
+                tenant.id, window_start, window_end
+            )
+        except RequestException as err:
+            logger.info(
+                "Could not fetch %s from %s to %s: %s",
+                tenant.name,
+                window_start.strftime("%Y-%m-%d"),
+                window_end.strftime("%Y-%m-%d"),
+                err,
+            )
+            self.failed_windows.append((tenant, window_start, window_end))
+            return []
+
+        return [
+            slot for entry in availability_entries for slot in select(entry, tenant.id)
+        ]
+
+    def __match_slots(self, entry: Dict, tenant_id: Text) -> List[Slot]:
+        """
+        Match the slots of an entry against the reserver preferences.
+        """
+        return [
+            slot
+            for slot in self.reserver.find_slots(entry, tenant_id)
+            if slot["start_date"].weekday() in self.reserver.days
+        ]
@@ -1,16 +1,20 @@
 # Native imports
+import threading
+from pathlib import Path
 from datetime import datetime
-from typing import Text, Dict, List
+from typing import Text, Dict, List, Any, Callable, Hashable, Optional, Union
 from typing_extensions import TypedDict
 
 # 3rd party imports
 import pytz
 import requests
 
+# Project imports
+from playtomic_scheduler.config import settings
+from .recorder import RecordingAdapter, ReplayAdapter
+from .ratelimit import RateLimiter, BOOKING, SCAN, get_default_limiter
 
 # Constants
-API_URL = "https://playtomic.io/api/v1"
-AUTH_URL = "https://playtomic.io/api/v3"
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
@@ -36,6 +40,61 @@ class Match(TypedDict):
     status: Text
 
 
+class _Call:
+    """
+    In-flight call shared by every caller of the same key.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls: while a call for a key is in
+    flight, other callers of the same key wait for it and share its result
+    (or error) instead of issuing their own. Nothing is cached afterwards.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run the function for the key unless an identical call is in flight.
+        """
+        with self.__lock:
+            call = self.__calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self.__calls[key] = _Call()
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.done.set()
+
+        return call.result
+
+
+# Calls shared by every client of the process
+flights = SingleFlight()
+
+
 class Playtomic:
 
     # Attributes
@@ -44,10 +103,28 @@ class Playtomic:
     session: requests.Session
     access_token: Text
     user_id: Text
+    limiter: Optional[RateLimiter]
+    api_url: Text
+    auth_url: Text
 
-    def __init__(self, email: Text, password: Text):
+    def __init__(
+        self,
+        email: Text,
+        password: Text,
+        limiter: Union[RateLimiter, bool, None] = True,
+        api_url: Optional[Text] = None,
+        auth_url: Optional[Text] = None,
+    ):
         self.email = email
         self.password = password
+        self.api_url = (api_url or settings.api_url).rstrip("/")
+        self.auth_url = (auth_url or settings.auth_url).rstrip("/")
+        self.access_token = None
+        self.user_id = None
+
+        # True shares the limiter configured through settings, None or
+        # False disables rate limiting without touching its database
+        self.limiter = get_default_limiter() if limiter is True else limiter or None
         self.session = requests.Session()
         self.session.headers.update(self.__get_headers())
 
@@ -60,26 +137,78 @@ class Playtomic:
             "X-Requested-With": "com.playtomic.web",
         }
 
+    def record(self, path: Path):
+        """
+        Record every request/response pair of the session to the given file.
+        """
+        adapter = RecordingAdapter(path)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def replay(self, path: Path, latency_scale: float = 1.0):
+        """
+        Serve the session requests from a recording instead of the network.
+        """
+        adapter = ReplayAdapter(path, latency_scale)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Replayed traffic never reaches the API
+        self.limiter = None
+
+    def __throttle(self, priority: Text):
+        """
+        Wait for the rate limiter of the given priority lane.
+        """
+        if self.limiter:
+            self.limiter.acquire(priority)
+
     def login(self) -> AuthPayload:
         """
         Login to Playtomic API.
         """
-        url = f"{AUTH_URL}/auth/login"
+        url = f"{self.auth_url}/auth/login"
         data = {"email": self.email, "password": self.password}
 
         # Make HTTP request
+        self.__throttle(BOOKING)
         response = self.session.post(url, json=data, timeout=5)
         response.raise_for_status()
         response: AuthPayload = response.json()
 
-        # Get user ID and access token
-        self.access_token = response.get("access_token")
-        self.user_id = response.get("user_id")
+        self.authenticate(response.get("access_token"), response.get("user_id"))
+
+        return response
+
+    def authenticate(self, access_token: Text, user_id: Text):
+        """
+        Use the access token of a previous login (e.g. of another process).
+        """
+        self.access_token = access_token
+        self.user_id = user_id
 
         # Set authorization header
         self.session.headers.update({"Authorization": f"Bearer {self.access_token}"})
 
-        return response
+    def __get(self, url: Text, params: Dict, priority: Text = SCAN):
+        """
+        Make a GET request. Scan requests are coalesced with identical
+        in-flight requests of the same access token. Booking requests are
+        always sent on their own, as a call started before the last booking
+        was confirmed would return stale data.
+        """
+
+        def request():
+            self.__throttle(priority)
+            response = self.session.get(url, params=params, timeout=5)
+            response.raise_for_status()
+            return response.json()
+
+        if priority == BOOKING:
+            return request()
+
+        key = ("GET", url, tuple(sorted(params.items())), self.access_token)
+        return flights.do(key, request)
 
     def fetch_availability(self, tenant_id, start_date, end_date):
         """
@@ -88,7 +217,7 @@ class Playtomic:
         if not self.access_token:
             self.login()
 
-        url = f"{API_URL}/availability"
+        url = f"{self.api_url}/availability"
         params = {
             "user_id": "me",
             "tenant_id": tenant_id,
@@ -98,10 +227,7 @@ class Playtomic:
         }
 
         # Make HTTP request
-        response = self.session.get(url, params=params, timeout=5)
-        response.raise_for_status()
-
-        return response.json()
+        return self.__get(url, params)
 
     def create_payment_intent(self, data: Dict) -> PaymentIntent:
         """
@@ -110,9 +236,10 @@ class Playtomic:
         if not self.access_token:
             self.login()
 
-        url = f"{API_URL}/payment_intents"
+        url = f"{self.api_url}/payment_intents"
 
         # Make HTTP request
+        self.__throttle(BOOKING)
         response = self.session.post(url, json=data, timeout=5)
         response.raise_for_status()
 
@@ -125,9 +252,10 @@ class Playtomic:
         if not self.access_token:
             self.login()
 
-        url = f"{API_URL}/payment_intents/{payment_intent_id}"
+        url = f"{self.api_url}/payment_intents/{payment_intent_id}"
 
         # Make HTTP request
+        self.__throttle(BOOKING)
         response = self.session.patch(url, json=data, timeout=5)
         response.raise_for_status()
 
@@ -140,29 +268,28 @@ class Playtomic:
         if not self.access_token:
             self.login()
 
-        url = f"{API_URL}/payment_intents/{payment_intent_id}/confirmation"
+        url = f"{self.api_url}/payment_intents/{payment_intent_id}/confirmation"
 
         # Make HTTP request
+        self.__throttle(BOOKING)
         response = self.session.post(url, timeout=5)
         response.raise_for_status()
 
         return response.json()
 
-    def get_matches(self, size: int, sort: Text) -> List[Match]:
+    def get_matches(self, size: int, sort: Text, priority: Text = SCAN) -> List[Match]:
         """
-        Get list of matches.
+        Get list of matches. Checks done while booking should use the
+        BOOKING priority lane so they do not wait behind scans.
         """
         if not self.access_token:
             self.login()
 
-        url = f"{API_URL}/matches"
+        url = f"{self.api_url}/matches"
         params = {"size": str(size), "sort": sort, "owner_id": self.user_id}
 
         # Make HTTP request
-        response = self.session.get(url, params=params, timeout=5)
-        response.raise_for_status()
-
-        return response.json()
+        return self.__get(url, params, priority)
 
     def prepare_payment_intent_data(
         self,
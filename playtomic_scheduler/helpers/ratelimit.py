@@ -0,0 +1,158 @@
+# Native imports
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from contextlib import closing
+from typing import Text, Optional, Union
+
+# Project imports
+from playtomic_scheduler.config import settings
+from playtomic_scheduler.utils import directory
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+# Constants
+RATE_LIMIT_FILE_NAME = "ratelimit.db"
+BOOKING = "booking"
+SCAN = "scan"
+MAX_SLEEP = 1.0
+
+
+class RateLimitTimeout(Exception):
+    """
+    Raised when no token could be acquired before the timeout.
+    """
+
+
+class RateLimiter:
+    """
+    Token bucket stored in SQLite so every process using the same CLI
+    directory shares one request budget. Scan requests can only drain the
+    bucket down to the reserved tokens, which are kept for bookings.
+    """
+
+    path: Path
+    name: Text
+    rate: float
+    burst: int
+    reserved: int
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        reserved: int = 0,
+        path: Optional[Union[Text, Path]] = None,
+        name: Text = "playtomic",
+    ):
+        if reserved >= burst:
+            raise ValueError("Reserved tokens must be lower than the burst size.")
+
+        self.path = Path(path) if path else directory.setup_dir() / RATE_LIMIT_FILE_NAME
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.reserved = reserved
+
+        with closing(self.__connect()) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO buckets (name, tokens, updated_at) VALUES (?, ?, ?)",
+                (self.name, float(self.burst), time.time()),
+            )
+
+    def __connect(self):
+        """
+        Open a connection in autocommit mode so transactions are explicit.
+        """
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def __try_acquire(self, priority: Text) -> float:
+        """
+        Try to take a token from the bucket.
+
+        Returns
+            0 if a token was taken, otherwise the seconds to wait for one.
+        """
+        floor = 0 if priority == BOOKING else self.reserved
+        now = time.time()
+
+        with closing(self.__connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                tokens, updated_at = conn.execute(
+                    "SELECT tokens, updated_at FROM buckets WHERE name = ?",
+                    (self.name,),
+                ).fetchone()
+
+                # Refill the bucket for the elapsed time
+                tokens = min(
+                    float(self.burst), tokens + max(0, now - updated_at) * self.rate
+                )
+
+                wait = 0.0
+                if tokens - 1 >= floor:
+                    tokens -= 1
+                else:
+                    wait = (floor + 1 - tokens) / self.rate
+
+                conn.execute(
+                    "UPDATE buckets SET tokens = ?, updated_at = ? WHERE name = ?",
+                    (tokens, now, self.name),
+                )
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+
+        return wait
+
+    def acquire(self, priority: Text = SCAN, timeout: Optional[float] = None):
+        """
+        Block until a token is available for the given priority lane.
+
+        Arguments
+            priority: BOOKING requests may use the reserved tokens, SCAN may not.
+            timeout: Seconds to wait before raising RateLimitTimeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            wait = self.__try_acquire(priority)
+            if not wait:
+                return
+
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise RateLimitTimeout(f"No {priority} token available in {timeout}s.")
+
+            time.sleep(min(wait, MAX_SLEEP))
+
+
+# Limiter shared by every client of the process
+_default_limiter: Optional[RateLimiter] = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_default_limiter() -> Optional[RateLimiter]:
+    """
+    Get the limiter configured through settings (None when disabled).
+    """
+    global _default_limiter  # pylint: disable=W0603
+
+    if settings.rate_limit <= 0:
+        return None
+
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            _default_limiter = RateLimiter(
+                settings.rate_limit,
+                settings.rate_burst,
+                settings.rate_reserved,
+            )
+
+    return _default_limiter
@@ -0,0 +1,191 @@
+# Native imports
+import gzip
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from urllib.parse import urlsplit
+from typing import Text, Dict, List, Union, Optional
+
+# 3rd party imports
+import requests
+from requests.adapters import HTTPAdapter, BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Project imports
+from playtomic_scheduler.utils import directory
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+# Constants
+REDACTED = "***"
+RECORDINGS_DIR = "recordings"
+RECORDING_SUFFIX = ".jsonl.gz"
+REDACTED_FIELDS = {"email", "password", "access_token", "refresh_token"}
+REDACTED_HEADERS = {"authorization", "cookie", "set-cookie"}
+
+
+def get_recording_path(name: Union[Text, Path]) -> Path:
+    """
+    Get the path of a recording. Plain names are stored in the recordings
+    directory of the CLI.
+    """
+    path = Path(name)
+    if path.suffix or path.parent != Path("."):
+        return path
+
+    return directory.setup_dir(RECORDINGS_DIR) / f"{name}{RECORDING_SUFFIX}"
+
+
+def _redact(value):
+    """
+    Redact the credentials of a JSON document.
+    """
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if key in REDACTED_FIELDS else _redact(item)
+            for key, item in value.items()
+        }
+
+    if isinstance(value, list):
+        return [_redact(item) for item in value]
+
+    return value
+
+
+def _redact_body(body: Optional[Union[Text, bytes]]) -> Optional[Text]:
+    """
+    Redact the credentials of a request or response body.
+    """
+    if body is None:
+        return None
+
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+
+    try:
+        return json.dumps(_redact(json.loads(body)))
+    except ValueError:
+        return body
+
+
+def _redact_headers(headers) -> Dict:
+    """
+    Redact the credentials of HTTP headers.
+    """
+    return {
+        key: REDACTED if key.lower() in REDACTED_HEADERS else value
+        for key, value in headers.items()
+    }
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    Transport adapter that stores every request/response pair, without
+    credentials, in a compressed JSON lines file.
+    """
+
+    path: Path
+
+    def __init__(self, path: Path, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.__lock = threading.Lock()
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=W0221
+        started_at = time.monotonic()
+        response = super().send(request, *args, **kwargs)
+        elapsed = time.monotonic() - started_at
+
+        record = {
+            "method": request.method,
+            "url": request.url,
+            "request_headers": _redact_headers(request.headers),
+            "request_body": _redact_body(request.body),
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": _redact_headers(response.headers),
+            "body": _redact_body(response.content),
+            "elapsed": elapsed,
+        }
+
+        with self.__lock:
+            with gzip.open(self.path, "at", encoding="utf-8") as recording:
+                recording.write(json.dumps(record) + "\n")
+
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Transport adapter that serves recorded responses back in order. Requests
+    are matched on method and URL, falling back to method and path so scans
+    replayed on a different day still get the recorded payloads. Every
+    record is served once.
+    """
+
+    latency_scale: float
+
+    def __init__(self, path: Path, latency_scale: float = 1.0):
+        super().__init__()
+        self.latency_scale = latency_scale
+        self.__lock = threading.Lock()
+        self.__records: List[Dict] = self.load(path)
+
+    @staticmethod
+    def load(path: Path) -> List[Dict]:
+        """
+        Load the records of a recording.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as recording:
+            return [json.loads(line) for line in recording if line.strip()]
+
+    def __next_record(self, request) -> Optional[Dict]:
+        """
+        Pop the first record matching the request URL, or else its path.
+        """
+        path = urlsplit(request.url).path
+        with self.__lock:
+            fallback = None
+            for index, record in enumerate(self.__records):
+                if record["method"] != request.method:
+                    continue
+
+                if record["url"] == request.url:
+                    return self.__records.pop(index)
+
+                if fallback is None and urlsplit(record["url"]).path == path:
+                    fallback = index
+
+            if fallback is not None:
+                return self.__records.pop(fallback)
+
+        return None
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=W0221
+        record = self.__next_record(request)
+
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.encoding = "utf-8"
+
+        if record is None:
+            logger.warning("No recording for %s %s", request.method, request.url)
+            response.status_code = 404
+            response.reason = "Not Recorded"
+            response._content = b""  # pylint: disable=W0212
+            return response
+
+        time.sleep(record["elapsed"] * self.latency_scale)
+
+        response.status_code = record["status_code"]
+        response.reason = record["reason"]
+        response.headers = CaseInsensitiveDict(record["headers"])
+        response._content = (record["body"] or "").encode()  # pylint: disable=W0212
+        return response
+
+    def close(self):
+        pass
@@ -1,150 +1,383 @@
 # Native imports
 import logging
-from typing import List, Dict, Text
-from datetime import datetime, timedelta
+from typing import List, Dict, Text, Iterator, Optional, Tuple, FrozenSet
+from datetime import datetime, timedelta, time, timezone
+from typing_extensions import TypedDict
 
 # 3rd party imports
+import numpy as np
 from requests.exceptions import HTTPError
 
 # Project imports
+from playtomic_scheduler.config import settings, Profile, Tenant
 from playtomic_scheduler.utils import date
+from playtomic_scheduler.utils.price import parse_price
+from .lease import LeaseStore
+from .checkpoint import CheckpointStore, CREATED, UPDATED, CONFIRMED, ABORTED
 from .playtomic import Playtomic
+from .ratelimit import BOOKING, SCAN
 
 logger = logging.getLogger("playtomic-scheduler-cli")
 
 # Constants
-DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+MATCH_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
+LEASE_WAIT = 30
+INTENT_TTL = 600
+
+
+class Slot(TypedDict):
+    tenant_id: Text
+    resource_id: Text
+    start_date: datetime
+    duration: int
+    price: Optional[Text]
+
+
+def parse_slot_dates(
+    start_date: Text, start_times: List[Text]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse the UTC starts of the slots of a day to the local timezone.
+
+    Returns
+        The local wall-clock dates and their UTC offsets.
+    """
+    return date.parse_utc_to_local_array(
+        [f"{start_date} {start_time}" for start_time in start_times]
+    )
+
+
+def parse_slots(entry: Dict, tenant_id: Text) -> Iterator[Slot]:
+    """
+    Parse every slot of an availability entry.
+    """
+    resource_id = entry.get("resource_id")
+    slots = entry.get("slots")
+    if not slots:
+        return
+
+    local_dates, offsets = parse_slot_dates(
+        entry.get("start_date"), [slot["start_time"] for slot in slots]
+    )
+    for slot, start_date in zip(slots, date.to_datetimes(local_dates, offsets)):
+        yield Slot(
+            tenant_id=tenant_id,
+            resource_id=resource_id,
+            start_date=start_date,
+            duration=slot.get("duration"),
+            price=slot.get("price"),
+        )
 
 
 class Reserver:
     playtomic: Playtomic
-    days: List[int]
-    hours: str
+    profile: Profile
+    days: FrozenSet[int]
+    hours: FrozenSet[time]
     duration: float
+    reservations_per_week: int
+    lease: Optional[LeaseStore]
+    checkpoint: Optional[CheckpointStore]
+    horizon_days: int
+    scan_mode: Text
     reservation_confirmed = False
+    stopping = False
 
     def __init__(
         self,
         playtomic: Playtomic,
-        target_days: str,
-        target_hours: str,
-        target_duration: str,
+        profile: Profile,
+        lease: Optional[LeaseStore] = None,
+        horizon_days: Optional[int] = None,
+        scan_mode: Optional[Text] = None,
+        checkpoint: Optional[CheckpointStore] = None,
     ):
         self.playtomic = playtomic
-        self.days = self.__parse_target_days(target_days)
-        self.hours = target_hours
-        self.duration = float(target_duration)
+        self.profile = profile
+        self.days = profile.days
+        self.hours = profile.hours
+        self.duration = profile.duration
+        self.reservations_per_week = profile.reservations_per_week
+        self.lease = lease
+        self.checkpoint = checkpoint
+        self.horizon_days = horizon_days or settings.scan_horizon_days
+        self.scan_mode = scan_mode or settings.scan_mode
+        self.__tenants = {tenant.id: tenant for tenant in profile.tenants}
+        self.__resource_ranks = {
+            resource_id: rank
+            for rank, resource_id in enumerate(profile.preferred_resources)
+        }
+        self.__window_days = {}
+        self.__hour_seconds = np.array(
+            [hour.hour * 3600 + hour.minute * 60 + hour.second for hour in self.hours]
+        )
 
-    def __parse_target_days(self, days: str):
+    def stop(self):
         """
-        Parse the desired days to reserve courts.
+        Stop at the next safe point: no more windows are scanned and no new
+        booking is started, but a booking in progress is completed.
         """
-        days = days.split(",")
-        if not isinstance(days, list):
-            raise ValueError(
-                "Days must be provided as numeric days separated by commas."
-            )
+        self.stopping = True
 
-        return [int(d) - 1 for d in days]
+    def get_week_matches(self, priority: Text = SCAN) -> Dict[Text, int]:
+        """
+        Count the pending matches of the account grouped by ISO week.
+        """
+        matches = self.playtomic.get_matches(10, "start_date,desc", priority)
+
+        # Skip the matches that are not pending
+        match_dates = [
+            match.get("start_date")
+            for match in matches
+            if match.get("status") == "PENDING"
+        ]
+        if not match_dates:
+            return {}
+
+        local_dates, _ = date.parse_utc_to_local_array(match_dates)
+        week_keys, counts = np.unique(
+            date.get_week_key_array(local_dates), return_counts=True
+        )
+        return dict(zip(week_keys.tolist(), counts.tolist()))
 
-    def __parse_target_dates(self, base_date: datetime):
+    def get_scan_dates(self, reservations_per_week: Optional[int] = None):
         """
-        Parse the target hour to reserve courts.
+        Get the target days within the scan horizon that should be scanned
+        for available courts.
         """
-        hours = self.hours.split(",")
-        if not isinstance(hours, list):
-            raise ValueError(
-                "Hours must be provided as a string of hours separated by commas."
-            )
+        reservations_per_week = reservations_per_week or self.reservations_per_week
 
-        # Parse target hours as datetime objects
-        target_dates = []
+        # Setup start date
+        start_date = date.set_start_of_day(datetime.now())
+        week_matches = self.get_week_matches().get(date.get_week_key(start_date), 0)
 
-        for hour in hours:
-            target_date = date.parse_datetime(hour, base_date)
-            target_dates.append(target_date)
+        if week_matches >= reservations_per_week:
+            # Skip current week if limit reached
+            start_date += timedelta(days=7 - start_date.weekday())
+        else:
+            # If no matches currently, skip the configured offset
+            start_date += timedelta(days=settings.scan_offset_days)
+
+        search_date_limit = datetime.now() + timedelta(days=self.horizon_days)
 
-        return target_dates
+        scan_dates = []
+        while start_date < search_date_limit:
+            if start_date.weekday() in self.days:
+                scan_dates.append(start_date)
 
-    def process_tenant(self, tenant: dict, reservations_per_week: int = 1):
+            start_date += timedelta(days=1)
+
+        return scan_dates
+
+    def get_scan_windows(
+        self, scan_dates: List[datetime]
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Group the scan dates in the windows requested to the API. In day mode
+        each date is its own window, in range mode consecutive dates are merged
+        up to the configured window size.
+        """
+        windows = []
+        for scan_date in scan_dates:
+            start_date = date.set_start_of_day(scan_date)
+            end_date = date.set_end_of_day(scan_date)
+
+            if self.scan_mode == "range" and windows:
+                window_start, window_end = windows[-1]
+                window_days = (end_date - window_start).days + 1
+                is_consecutive = start_date - window_end < timedelta(seconds=1)
+                if is_consecutive and window_days <= settings.scan_window_days:
+                    windows[-1] = (window_start, end_date)
+                    continue
+
+            windows.append((start_date, end_date))
+
+        return windows
+
+    def process_tenant(
+        self, tenant: Tenant, reservations_per_week: Optional[int] = None
+    ):
         """
         Process the tenant and reserve the court.
         """
-        tenant_id = tenant.get("id")
-        tenant_name = tenant.get("name")
-        logger.info("Verifying courts for %s...", tenant_name)
+        logger.info("Verifying courts for %s...", tenant.name)
 
-        # Check matches for the week
-        week_matches = 0
-        matches = self.playtomic.get_matches(10, "start_date,desc")
-        for match in matches:
-            # Skip if match is not pending
-            if match.get("status") != "PENDING":
-                continue
+        scan_dates = self.get_scan_dates(reservations_per_week)
+        for start_date, end_date in self.get_scan_windows(scan_dates):
+            if self.stopping:
+                return
 
-            # Check if match is within the current week
-            match_date = match.get("start_date")
-            match_date = datetime.strptime(match_date, "%Y-%m-%dT%H:%M:%S")
-            match_date = date.parse_utc_to_local(match_date)
+            self.process_window(tenant, start_date, end_date)
 
-            if date.is_within_current_week(match_date):
-                week_matches += 1
+    def process_window(self, tenant: Tenant, start_date: datetime, end_date: datetime):
+        """
+        Process a window of days of the tenant and reserve the court.
+        """
+        tenant_id = tenant.id
 
-        # Setup start and end date
-        start_date = date.set_start_of_day(datetime.now())
+        # Fetch availability
+        availability_entries = self.fetch_window(tenant_id, start_date, end_date)
 
-        if week_matches >= reservations_per_week:
-            # Skip current week if limit reached
-            start_date += timedelta(days=7 - start_date.weekday())
-        else:
-            # If no matches currently, skip to the next 2 day
-            start_date += timedelta(days=2)
+        # Process each availability entry
+        logger.info(
+            "Looking courts from %s to %s...",
+            start_date.strftime("%Y-%m-%d"),
+            end_date.strftime("%Y-%m-%d"),
+        )
+        self.process_availibility(availability_entries, tenant_id)
 
-        end_date = date.set_end_of_day(start_date)
-        search_date_limit = datetime.now() + timedelta(days=7)
+    def fetch_window(
+        self, tenant_id: Text, start_date: datetime, end_date: datetime
+    ) -> List[Dict]:
+        """
+        Fetch the availability of a window of days. Windows are split in
+        halves when the API rejects them or the response looks truncated, and
+        the working window size is remembered for the next windows of the
+        tenant.
+        """
+        window_days = (end_date.date() - start_date.date()).days + 1
+        max_window_days = self.__window_days.get(tenant_id, window_days)
+
+        if window_days <= max_window_days:
+            try:
+                entries = self.playtomic.fetch_availability(
+                    tenant_id, start_date, end_date
+                )
+                if window_days == 1 or len(entries) < settings.scan_max_entries:
+                    return entries
+            except HTTPError as err:
+                status_code = err.response.status_code
+                if (
+                    window_days == 1
+                    or status_code in (401, 403, 429)
+                    or status_code >= 500
+                ):
+                    raise
+
+            # Remember a smaller window size for this tenant
+            max_window_days = max(1, window_days // 2)
+            self.__window_days[tenant_id] = max_window_days
+            logger.info("Splitting availability window of %s days.", window_days)
+
+        # Split the window in two halves
+        split_days = min(max_window_days, (window_days + 1) // 2)
+        middle_date = date.set_start_of_day(start_date) + timedelta(days=split_days)
+
+        return self.fetch_window(
+            tenant_id, start_date, date.set_end_of_day(middle_date - timedelta(days=1))
+        ) + self.fetch_window(tenant_id, middle_date, end_date)
+
+    def get_resource_properties(self, entry: Dict, tenant_id: Text) -> Dict:
+        """
+        Get the court properties of an availability entry: the ones
+        configured for the tenant overridden by any sent in the payload.
+        """
+        tenant = self.__tenants.get(tenant_id)
+        properties = dict(
+            tenant.get_resource_properties(entry.get("resource_id")) if tenant else {}
+        )
+        properties.update(entry.get("properties") or {})
+        properties.update(
+            {
+                key: value
+                for key, value in entry.items()
+                if key in self.profile.court_properties and key != "properties"
+            }
+        )
+        return properties
 
-        while start_date < search_date_limit:
-            # Fetch availability
-            availability_entries = self.playtomic.fetch_availability(
-                tenant_id,
-                start_date,
-                end_date,
-            )
+    def matches_resource(self, entry: Dict, tenant_id: Text) -> bool:
+        """
+        Check if the court of an availability entry has the target properties.
+        """
+        if not self.profile.court_properties:
+            return True
 
-            # Process each availability entry
-            logger.info("Looking courts at %s...", start_date.strftime("%Y-%m-%d"))
-            for entry in availability_entries:
-                self.process_availibility(entry, tenant_id)
+        properties = self.get_resource_properties(entry, tenant_id)
+        for key, expected in self.profile.court_properties.items():
+            value = properties.get(key)
+            if isinstance(value, str) and isinstance(expected, str):
+                if value.lower() != expected.lower():
+                    return False
+            elif value != expected:
+                return False
 
-            # Increment the dates
-            start_date += timedelta(days=1)
-            end_date += timedelta(days=1)
+        return True
 
-    def process_availibility(self, entry: Dict, tenant_id: str):
+    def find_slots(self, entry: Dict, tenant_id: str) -> Iterator[Slot]:
         """
-        Process the availability entries.
+        Find the slots of an availability entry matching the target court,
+        duration, price and hours. Cheap checks run first so rejected slots
+        skip date parsing. This has no side effects.
         """
+        # Validate court properties once per entry
+        if not self.matches_resource(entry, tenant_id):
+            return
+
         resource_id = entry.get("resource_id")
-        start_date_str = entry.get("start_date")
+        max_price = self.profile.max_price
 
-        # Process each slot
+        # Validate court duration and price
+        candidates = []
         for slot in entry.get("slots"):
-            # Validate court duration
-            slot_duration = slot.get("duration")
-            if slot_duration != self.duration * 60:
+            if slot.get("duration") != self.profile.duration_minutes:
                 continue
 
-            # Validate court start time
-            slot_time = slot["start_time"]
-            slot_start_date_str = f"{start_date_str} {slot_time}"
-            slot_start_date = datetime.strptime(slot_start_date_str, DATE_FORMAT)
-            slot_start_date = date.parse_utc_to_local(slot_start_date)
+            if max_price is not None:
+                slot_price = parse_price(slot.get("price"))
+                if slot_price is None or slot_price > max_price:
+                    continue
 
-            # Check if the slot is within the target hours
-            target_dates = self.__parse_target_dates(slot_start_date)
-            if slot_start_date not in target_dates:
-                continue
+            candidates.append(slot)
+
+        if not candidates:
+            return
+
+        # Parse the start of the candidates at once and keep the target hours
+        local_dates, offsets = parse_slot_dates(
+            entry.get("start_date"), [slot["start_time"] for slot in candidates]
+        )
+        in_hours = np.isin(date.get_time_of_day_array(local_dates), self.__hour_seconds)
+        if not in_hours.any():
+            return
+
+        start_dates = date.to_datetimes(local_dates[in_hours], offsets[in_hours])
+        kept = [slot for slot, keep in zip(candidates, in_hours) if keep]
+        for slot, slot_start_date in zip(kept, start_dates):
+            yield Slot(
+                tenant_id=tenant_id,
+                resource_id=resource_id,
+                start_date=slot_start_date,
+                duration=slot["duration"],
+                price=slot.get("price"),
+            )
+
+    def get_slot_rank(self, slot: Slot) -> Tuple:
+        """
+        Get the sorting key of a slot: preferred courts first, then the
+        cheapest and the earliest.
+        """
+        resource_rank = self.__resource_ranks.get(
+            slot["resource_id"], len(self.__resource_ranks)
+        )
+        price = parse_price(slot["price"])
+        return (
+            resource_rank,
+            float("inf") if price is None else price,
+            slot["start_date"],
+        )
+
+    def process_availibility(self, entries: List[Dict], tenant_id: str):
+        """
+        Process the availability entries of a window, trying to reserve the
+        best ranked court first.
+        """
+        slots = [
+            slot for entry in entries for slot in self.find_slots(entry, tenant_id)
+        ]
 
+        for slot in sorted(slots, key=self.get_slot_rank):
+            slot_start_date = slot["start_date"]
             readable_date = slot_start_date.strftime("%Y %b %d - %I:%M %p")
             logger.info("Found a valid court: %s", readable_date)
 
@@ -152,23 +385,59 @@ class Reserver:
             if (
                 slot_start_date.weekday() in self.days
                 and not self.reservation_confirmed
+                and not self.stopping
             ):
-                self.reserve_court(tenant_id, resource_id, slot_start_date)
+                self.reserve_court(tenant_id, slot["resource_id"], slot_start_date)
 
     def reserve_court(self, tenant_id: Text, resource_id: Text, start_date: datetime):
         """
-        Reserve the court.
+        Reserve the court. When a lease store is configured, the booking is
+        done while holding the lease of the account week and only if the
+        weekly reservations limit has not been reached yet.
+        """
+        if not self.lease:
+            self.book_court(tenant_id, resource_id, start_date)
+            return
+
+        week_key = date.get_week_key(start_date)
+        lease_key = f"{self.playtomic.email}:{week_key}"
+
+        with self.lease.hold(lease_key, wait=LEASE_WAIT) as acquired:
+            if not acquired:
+                logger.info("Another worker is booking week %s. Skipping.", week_key)
+                return
+
+            week_matches = self.get_week_matches(BOOKING).get(week_key, 0)
+            if week_matches >= self.reservations_per_week:
+                logger.info("Reservations limit reached for week %s.", week_key)
+                return
+
+            self.book_court(tenant_id, resource_id, start_date)
+
+    def book_court(self, tenant_id: Text, resource_id: Text, start_date: datetime):
+        """
+        Create, update and confirm the payment intent of the court.
         """
         data = self.playtomic.prepare_payment_intent_data(
             tenant_id,
             resource_id,
             start_date,
-            int(self.duration * 60),
+            self.profile.duration_minutes,
         )
 
+        booking_id = None
+        if self.checkpoint:
+            booking_id = self.checkpoint.begin(
+                self.playtomic.email,
+                tenant_id,
+                resource_id,
+                start_date.astimezone(timezone.utc).strftime(MATCH_DATE_FORMAT),
+            )
+
         try:
             # Create payment intent
             payment_intent = self.playtomic.create_payment_intent(data)
+            self.__advance(booking_id, CREATED, payment_intent.get("payment_intent_id"))
 
             # Update payment intent
             payment_methods = payment_intent.get("available_payment_methods")
@@ -187,9 +456,11 @@ class Reserver:
             self.playtomic.update_payment_intent(
                 payment_intent.get("payment_intent_id"), data
             )
+            self.__advance(booking_id, UPDATED)
 
             # Confirm reservation
             self.playtomic.confirm_reservation(payment_intent.get("payment_intent_id"))
+            self.__advance(booking_id, CONFIRMED)
 
             logger.info(
                 "Reservation confirmed on %s",
@@ -197,6 +468,7 @@ class Reserver:
             )
             self.reservation_confirmed = True
         except HTTPError as err:
+            self.__advance(booking_id, ABORTED)
             logger.exception(
                 {
                     "data": data,
@@ -204,3 +476,114 @@ class Reserver:
                     "status_code": err.response.status_code,
                 }
             )
+
+    def __advance(
+        self,
+        booking_id: Optional[Text],
+        step: Text,
+        payment_intent_id: Optional[Text] = None,
+    ):
+        """
+        Record the booking step in the checkpoint store, if any.
+        """
+        if self.checkpoint and booking_id:
+            self.checkpoint.advance(booking_id, step, payment_intent_id)
+
+    def resume(self) -> bool:
+        """
+        Reconcile the bookings left pending by a previous run against the
+        matches of the account. Bookings found in the matches are marked as
+        confirmed, recent intents that only missed the confirmation are
+        confirmed and the rest are aborted. Aborted intents are only marked
+        locally: the API offers no way to cancel them, so unconfirmed intents
+        are left for Playtomic to expire.
+
+        Returns
+            Whether a reservation is confirmed after the reconciliation.
+        """
+        if not self.checkpoint:
+            return self.reservation_confirmed
+
+        pending = self.checkpoint.get_pending(self.playtomic.email)
+        if not pending:
+            return self.reservation_confirmed
+
+        logger.info("Reconciling %s pending bookings...", len(pending))
+        for booking in pending:
+            start_date = datetime.strptime(booking["start_date"], MATCH_DATE_FORMAT)
+            week_key = date.get_week_key(date.parse_utc_to_local(start_date))
+
+            if not self.lease:
+                self.__reconcile(booking["id"], week_key)
+                continue
+
+            # Bookings in progress hold the week lease, so a pending booking
+            # whose lease can be acquired belongs to a dead process
+            lease_key = f"{self.playtomic.email}:{week_key}"
+            with self.lease.hold(lease_key, wait=LEASE_WAIT) as acquired:
+                if not acquired:
+                    logger.info(
+                        "Another worker is booking week %s. Skipping.", week_key
+                    )
+                    continue
+
+                self.__reconcile(booking["id"], week_key)
+
+        return self.reservation_confirmed
+
+    def __reconcile(self, booking_id: Text, week_key: Text):
+        """
+        Settle a pending booking with the current matches of the account.
+        The booking is read again, as another process may have settled it
+        while the lease was awaited.
+        """
+        booking = self.checkpoint.get(booking_id)
+        if booking is None or booking["step"] in (CONFIRMED, ABORTED):
+            return
+
+        matches = self.playtomic.get_matches(10, "start_date,desc", BOOKING)
+        for match in matches:
+            if match.get("status") == "CANCELED":
+                continue
+
+            if match.get("start_date") != booking["start_date"]:
+                continue
+
+            if (
+                match.get("resource_id", booking["resource_id"])
+                != booking["resource_id"]
+            ):
+                continue
+
+            logger.info(
+                "Pending booking of %s found in the matches.", booking["start_date"]
+            )
+            self.checkpoint.advance(booking["id"], CONFIRMED)
+            self.reservation_confirmed = True
+            return
+
+        is_recent = booking["updated_at"] > datetime.now().timestamp() - INTENT_TTL
+        week_matches = self.get_week_matches(BOOKING).get(week_key, 0)
+        if (
+            booking["step"] != UPDATED
+            or not is_recent
+            or week_matches >= self.reservations_per_week
+        ):
+            logger.info("Aborting pending booking of %s.", booking["start_date"])
+            self.checkpoint.advance(booking["id"], ABORTED)
+            return
+
+        try:
+            self.playtomic.confirm_reservation(booking["payment_intent_id"])
+        except HTTPError as err:
+            logger.info(
+                "Could not confirm pending booking of %s: %s",
+                booking["start_date"],
+                err.response.status_code,
+            )
+            self.checkpoint.advance(booking["id"], ABORTED)
+            return
+
+        logger.info("Pending booking of %s confirmed.", booking["start_date"])
+        self.checkpoint.advance(booking["id"], CONFIRMED)
+        self.reservation_confirmed = True
@@ -0,0 +1,166 @@
+# Native imports
+import logging
+from datetime import datetime, timedelta
+from typing import List, Dict, Text, Tuple, Iterable, Optional
+
+# Project imports
+from playtomic_scheduler.config import Tenant, WatchRule
+from .notifier import Notifier
+from .planner import Planner
+from .reserver import Slot, parse_slots
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+# Constants
+SLOT_OPENED = "slot_opened"
+SLOT_TAKEN = "slot_taken"
+PRICE_CHANGED = "price_changed"
+ALL_DAYS = frozenset(range(7))
+
+
+def get_slot_key(slot: Slot) -> Tuple:
+    """
+    Get the key identifying a slot across scans.
+    """
+    return (
+        slot["tenant_id"],
+        slot["resource_id"],
+        slot["start_date"].isoformat(),
+        slot["duration"],
+    )
+
+
+class Watcher:
+    """
+    Scan every tenant once per poll and evaluate all of the watch rules
+    against the changes between the last two scans.
+    """
+
+    planner: Planner
+    rules: Tuple[WatchRule, ...]
+    notifier: Notifier
+    horizon_days: int
+    snapshot: Optional[Dict[Tuple, Slot]]
+
+    def __init__(
+        self,
+        planner: Planner,
+        rules: Tuple[WatchRule, ...],
+        notifier: Notifier,
+        horizon_days: int,
+    ):
+        self.planner = planner
+        self.rules = rules
+        self.notifier = notifier
+        self.horizon_days = horizon_days
+        self.snapshot = None
+
+    def get_watch_days(self):
+        """
+        Get the days of the week needed by any of the rules.
+        """
+        days = set()
+        for rule in self.rules:
+            if rule.days is None:
+                return ALL_DAYS
+
+            days.update(rule.days)
+
+        return frozenset(days)
+
+    def poll(self, tenants: Iterable[Tenant]) -> List[Dict]:
+        """
+        Scan the tenants and notify the events detected since the last poll.
+        On the first poll every matching slot is reported as opened.
+        """
+        now = datetime.now()
+        watch_dates = self.planner.get_plan_dates(
+            now, now + timedelta(days=self.horizon_days), self.get_watch_days()
+        )
+        watch_days = {watch_date.date() for watch_date in watch_dates}
+
+        slots = self.planner.collect(tenants, watch_dates, parse_slots)
+        current = {get_slot_key(slot): slot for slot in slots}
+        previous = self.snapshot or {}
+
+        # Keep the last known slots of the windows that could not be fetched
+        for key, previous_slot in previous.items():
+            if self.__in_failed_window(previous_slot):
+                current.setdefault(key, previous_slot)
+
+        # Diff the scans once, rules are only evaluated against the changes
+        changes = []
+        for key, slot in current.items():
+            previous_slot = previous.get(key)
+            if previous_slot is None:
+                changes.append((SLOT_OPENED, slot, None))
+            elif previous_slot["price"] != slot["price"]:
+                changes.append((PRICE_CHANGED, slot, previous_slot))
+
+        for key, previous_slot in previous.items():
+            start_date = previous_slot["start_date"]
+            if key in current or start_date.date() not in watch_days:
+                continue
+            if start_date.replace(tzinfo=None) <= now:
+                continue
+
+            changes.append((SLOT_TAKEN, previous_slot, None))
+
+        events = []
+        detected_at = now.astimezone().isoformat()
+        for event_type, slot, previous_slot in changes:
+            for rule in self.rules:
+                is_match = rule.matches(slot)
+                if previous_slot is not None:
+                    is_match = is_match or rule.matches(previous_slot)
+                if not is_match:
+                    continue
+
+                events.append(
+                    self.__build_event(
+                        event_type, rule.name, slot, previous_slot, detected_at
+                    )
+                )
+
+        self.snapshot = current
+        for event in events:
+            self.notifier.notify(event)
+
+        logger.info("Watched %s slots, %s events.", len(current), len(events))
+        return events
+
+    def __in_failed_window(self, slot: Slot) -> bool:
+        """
+        Check if the slot belongs to a window that failed in the last scan.
+        """
+        start_date = slot["start_date"].replace(tzinfo=None)
+        return any(
+            tenant.id == slot["tenant_id"] and window_start <= start_date <= window_end
+            for tenant, window_start, window_end in self.planner.failed_windows
+        )
+
+    def __build_event(
+        self,
+        event_type: Text,
+        rule_name: Text,
+        slot: Slot,
+        previous_slot: Optional[Slot],
+        detected_at: Text,
+    ) -> Dict:
+        """
+        Build the structured event of a slot change.
+        """
+        event = {
+            "event": event_type,
+            "rule": rule_name,
+            "tenant_id": slot["tenant_id"],
+            "resource_id": slot["resource_id"],
+            "start_date": slot["start_date"].isoformat(),
+            "duration": slot["duration"],
+            "price": slot["price"],
+            "detected_at": detected_at,
+        }
+        if previous_slot is not None:
+            event["previous_price"] = previous_slot["price"]
+
+        return event
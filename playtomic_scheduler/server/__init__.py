@@ -0,0 +1,37 @@
+# Native imports
+import logging
+
+# 3rd party imports
+from flask import Flask
+from flask_cors import CORS
+
+# Project imports
+from playtomic_scheduler.config import settings
+from playtomic_scheduler.helpers.reserver import Reserver
+from .utils import init_logger
+from .helpers import AvailabilityCache
+from .blueprints import *  # pylint: disable=W0401
+
+# Initialize logger
+logger = logging.getLogger(settings.name)
+init_logger(logger, name=settings.name, env=settings.env)
+
+
+def create_app(reserver: Reserver) -> Flask:
+    """
+    Create and configure the Flask application.
+    """
+    # Configure the Flask app
+    app = Flask(__name__)
+    CORS(app)
+
+    # Share the availability cache between every request
+    app.extensions["availability_cache"] = AvailabilityCache(
+        reserver, settings.cache_ttl
+    )
+
+    # Register blueprints
+    app.register_blueprint(health_bp, url_prefix="/api")
+    app.register_blueprint(availability_bp, url_prefix="/api")
+
+    return app
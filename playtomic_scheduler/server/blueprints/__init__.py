@@ -1 +1,2 @@
-from app.blueprints.health import bp as health_bp
+from .health import bp as health_bp
+from .availability import bp as availability_bp
@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Text
+
+from flask import Blueprint, current_app, request
+from requests.exceptions import RequestException
+from playtomic_scheduler.utils import date
+from playtomic_scheduler.helpers.reserver import Slot, parse_slots
+from playtomic_scheduler.server.helpers import ResponseHelper
+
+bp = Blueprint("availability", __name__)
+
+# Constants
+MAX_DAYS = 31
+
+
+def _get_days() -> List[datetime]:
+    """
+    Get the days requested through the `date` and `days` query parameters.
+    """
+    start_date = request.args.get("date")
+    start_date = (
+        datetime.strptime(start_date, "%Y-%m-%d") if start_date else datetime.now()
+    )
+    days = int(request.args.get("days", 1))
+    if not 1 <= days <= MAX_DAYS:
+        raise ValueError(f"days must be between 1 and {MAX_DAYS}.")
+
+    start_date = date.set_start_of_day(start_date)
+    return [start_date + timedelta(days=day) for day in range(days)]
+
+
+def _collect(select: Callable[[Dict, Text], Iterable[Slot]]) -> List[Dict]:
+    """
+    Select the slots of the requested tenants and days from the cache.
+    """
+    cache = current_app.extensions["availability_cache"]
+    tenant_id = request.args.get("tenant_id")
+    after = request.args.get("after")
+    after = date.parse_time(after) if after else None
+    before = request.args.get("before")
+    before = date.parse_time(before) if before else None
+    days = _get_days()
+
+    tenants = [
+        tenant
+        for tenant in cache.reserver.profile.tenants
+        if not tenant_id or tenant.id == tenant_id
+    ]
+
+    slots = []
+    for tenant in tenants:
+        for day in days:
+            for entry in cache.get(tenant.id, day):
+                for slot in select(entry, tenant.id):
+                    start_time = slot["start_date"].time()
+                    if after and start_time < after:
+                        continue
+                    if before and start_time > before:
+                        continue
+
+                    slots.append({**slot, "tenant_name": tenant.name})
+
+    slots.sort(key=lambda slot: (slot["start_date"], slot["tenant_id"]))
+    for slot in slots:
+        slot["start_date"] = slot["start_date"].isoformat()
+
+    return slots
+
+
+@bp.route("/availability", methods=["GET"])
+def availability():
+    """
+    List every available slot of the configured tenants.
+
+    Query parameters:
+    - date (YYYY-MM-DD): First day, defaults to today.
+    - days (int): Number of days, defaults to 1.
+    - tenant_id (str): Only list this tenant.
+    - after / before (HH:MM): Only list slots starting in this time range.
+    """
+    try:
+        slots = _collect(parse_slots)
+    except ValueError as err:
+        return ResponseHelper.parse_response(400, {"message": str(err)})
+    except RequestException:
+        return ResponseHelper.parse_response(
+            502, {"message": "Could not get the availability from Playtomic."}
+        )
+
+    return ResponseHelper.parse_response(200, slots)
+
+
+@bp.route("/slots", methods=["GET"])
+def matching_slots():
+    """
+    List the available slots matching the configured preferences. Accepts
+    the same query parameters as /availability.
+    """
+    reserver = current_app.extensions["availability_cache"].reserver
+
+    def select(entry: Dict, tenant_id: Text):
+        return (
+            slot
+            for slot in reserver.find_slots(entry, tenant_id)
+            if slot["start_date"].weekday() in reserver.days
+        )
+
+    try:
+        slots = _collect(select)
+    except ValueError as err:
+        return ResponseHelper.parse_response(400, {"message": str(err)})
+    except RequestException:
+        return ResponseHelper.parse_response(
+            502, {"message": "Could not get the availability from Playtomic."}
+        )
+
+    return ResponseHelper.parse_response(200, slots)
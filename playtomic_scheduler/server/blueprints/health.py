@@ -1,6 +1,6 @@
 from flask import Blueprint
-from app.config import settings
-from app.helpers import ResponseHelper
+from playtomic_scheduler import __version__
+from playtomic_scheduler.server.helpers import ResponseHelper
 
 bp = Blueprint("health", __name__)
 
@@ -14,6 +14,6 @@ def status():
         200,
         {
             "status": "ok",
-            "version": settings.version,
+            "version": __version__.version,
         },
     )
@@ -1 +1,2 @@
-from app.helpers.response import ResponseHelper
+from .response import ResponseHelper
+from .cache import AvailabilityCache
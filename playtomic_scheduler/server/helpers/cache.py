@@ -0,0 +1,74 @@
+# Native imports
+import time
+import threading
+from datetime import datetime
+from typing import Dict, List, Text, Tuple
+
+# 3rd party imports
+from requests.exceptions import HTTPError
+
+# Project imports
+from playtomic_scheduler.utils import date
+from playtomic_scheduler.helpers.reserver import Reserver
+from playtomic_scheduler.helpers.playtomic import SingleFlight
+
+
+class AvailabilityCache:
+    """
+    In-memory cache of the availability of a tenant day, shared by every
+    request of the server. Entries expire after the TTL and concurrent
+    misses of the same day share a single upstream call.
+    """
+
+    reserver: Reserver
+    ttl: float
+
+    def __init__(self, reserver: Reserver, ttl: float):
+        self.reserver = reserver
+        self.ttl = ttl
+        self.__lock = threading.Lock()
+        self.__flights = SingleFlight()
+        self.__entries: Dict[Tuple[Text, Text], Tuple[float, List[Dict]]] = {}
+
+    def get(self, tenant_id: Text, day: datetime) -> List[Dict]:
+        """
+        Get the availability entries of a tenant day.
+        """
+        key = (tenant_id, day.date().isoformat())
+
+        with self.__lock:
+            cached = self.__entries.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
+        return self.__flights.do(key, lambda: self.__load(key, day))
+
+    def __load(self, key: Tuple[Text, Text], day: datetime) -> List[Dict]:
+        """
+        Fetch the availability of a tenant day and store it.
+        """
+        tenant_id = key[0]
+        start_date = date.set_start_of_day(day)
+        end_date = date.set_end_of_day(day)
+
+        try:
+            entries = self.reserver.fetch_window(tenant_id, start_date, end_date)
+        except HTTPError as err:
+            if err.response is None or err.response.status_code != 401:
+                raise
+
+            # Access token expired, login again and retry once
+            self.reserver.playtomic.login()
+            entries = self.reserver.fetch_window(tenant_id, start_date, end_date)
+
+        now = time.monotonic()
+        with self.__lock:
+            # Drop expired entries to keep the cache bounded
+            self.__entries = {
+                cached_key: cached
+                for cached_key, cached in self.__entries.items()
+                if cached[0] > now
+            }
+            self.__entries[key] = (now + self.ttl, entries)
+
+        return entries
@@ -12,4 +12,6 @@ class ResponseHelper:
         - status_code (int): HTTP status code.
         - result (Any): Response data.
         """
-        return jsonify({"code": status_code, "result": result})
+        response = jsonify({"code": status_code, "result": result})
+        response.status_code = status_code
+        return response
@@ -1 +1 @@
-from app.utils.logger import init_logger
+from .logger import init_logger
@@ -1,9 +1,14 @@
 # Native imports
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Text, Tuple
 
 # 3rd party imports
 import pytz
 import tzlocal
+import numpy as np
+
+# Fixed offset timezones shared by the datetimes built from arrays
+_offset_timezones: Dict[int, timezone] = {}
 
 
 def get_local_timezone():
@@ -68,3 +73,116 @@ def is_within_current_week(date: datetime):
     end_of_week = start_of_week + timedelta(days=6)
 
     return start_of_week <= date <= end_of_week
+
+
+def get_week_key(date: datetime):
+    """
+    Get the ISO year and week number for the provided date (e.g. 2024-W27).
+    """
+    iso_year, iso_week, _ = date.isocalendar()
+    return f"{iso_year}-W{iso_week:02d}"
+
+
+def parse_time(hour: str):
+    """
+    Parse the provided hour (HH:MM | HH:MM:SS) to a time object.
+    """
+    return parse_datetime(hour, datetime.min).time()
+
+
+def parse_datetime_array(values: Sequence[Text]) -> np.ndarray:
+    """
+    Parse ISO timestamps (YYYY-MM-DD HH:MM:SS, with a space or a T) to a
+    datetime64 array in one call.
+    """
+    return np.array(values, dtype="datetime64[s]")
+
+
+def get_utc_offset_array(
+    utc_dates: np.ndarray, timezone_name: Optional[Text] = None
+) -> np.ndarray:
+    """
+    Get the UTC offset of the timezone (local by default) at each of the
+    provided UTC dates. Offsets are resolved once per distinct minute, as
+    slots and matches share a handful of start times.
+    """
+    tz = pytz.timezone(timezone_name or get_local_timezone())
+    minutes, inverse = np.unique(utc_dates.astype("datetime64[m]"), return_inverse=True)
+    offsets = np.array(
+        [
+            int(pytz.utc.localize(minute).astimezone(tz).utcoffset().total_seconds())
+            for minute in minutes.astype(datetime)
+        ],
+        dtype=np.int64,
+    ).astype("timedelta64[s]")
+    return offsets[inverse.reshape(-1)]
+
+
+def parse_utc_to_local_array(
+    values: Sequence[Text], timezone_name: Optional[Text] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse UTC timestamps and shift them to the timezone (local by default).
+
+    Returns
+        The local wall-clock dates and their UTC offsets.
+    """
+    utc_dates = parse_datetime_array(values)
+    offsets = get_utc_offset_array(utc_dates, timezone_name)
+    return utc_dates + offsets, offsets
+
+
+def set_start_of_day_array(dates: np.ndarray) -> np.ndarray:
+    """
+    Set the start of the day for every provided date.
+    """
+    return dates.astype("datetime64[D]").astype(dates.dtype)
+
+
+def get_time_of_day_array(dates: np.ndarray) -> np.ndarray:
+    """
+    Get the seconds elapsed since the start of the day of every date.
+    """
+    return (dates - set_start_of_day_array(dates)).astype("timedelta64[s]").astype(int)
+
+
+def get_weekday_array(dates: np.ndarray) -> np.ndarray:
+    """
+    Get the weekday of every date (Monday is 0).
+    """
+    # 1970-01-01 was a Thursday
+    return (dates.astype("datetime64[D]").astype(int) + 3) % 7
+
+
+def get_week_key_array(dates: np.ndarray) -> np.ndarray:
+    """
+    Get the ISO year and week number of every date (e.g. 2024-W27).
+    """
+    days = dates.astype("datetime64[D]")
+
+    # The ISO week belongs to the year of its Thursday
+    thursdays = days - get_weekday_array(days) + 3
+    years = thursdays.astype("datetime64[Y]")
+    weeks = (thursdays - years.astype("datetime64[D]")).astype(int) // 7 + 1
+
+    return np.char.add(
+        np.char.add(years.astype(str), "-W"), np.char.zfill(weeks.astype(str), 2)
+    )
+
+
+def to_datetimes(local_dates: np.ndarray, offsets: np.ndarray) -> List[datetime]:
+    """
+    Convert local wall-clock dates and their UTC offsets back to timezone
+    aware datetime objects.
+    """
+    datetimes = []
+    for local_date, offset in zip(
+        local_dates.astype(datetime), offsets.astype(int).tolist()
+    ):
+        tz = _offset_timezones.get(offset)
+        if tz is None:
+            tz = _offset_timezones[offset] = timezone(timedelta(seconds=offset))
+
+        datetimes.append(local_date.replace(tzinfo=tz))
+
+    return datetimes
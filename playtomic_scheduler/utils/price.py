@@ -0,0 +1,23 @@
+# Native imports
+import re
+from typing import Optional
+
+# Constants
+PRICE_PATTERN = re.compile(r"-?\d+(?:[.,]\d+)?")
+
+
+def parse_price(price: Optional[str]) -> Optional[float]:
+    """
+    Parse the amount of a price string (e.g. "24.5 EUR") to a float.
+    """
+    if price is None:
+        return None
+
+    if isinstance(price, (int, float)):
+        return float(price)
+
+    match = PRICE_PATTERN.search(price)
+    if not match:
+        return None
+
+    return float(match.group().replace(",", "."))
@@ -0,0 +1,213 @@
+# Native imports
+import heapq
+import logging
+import itertools
+import threading
+from time import monotonic
+from datetime import datetime, time, timedelta
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger("playtomic-scheduler-cli")
+
+# Constants
+WALL_CLOCK_CHECK_INTERVAL = 60
+
+
+class Job:
+    """
+    Job scheduled on a Scheduler. Interval jobs repeat every `interval`
+    seconds, anchored jobs run at a wall-clock time (daily if recurring).
+    """
+
+    func: Callable[[], None]
+    interval: Optional[float]
+    anchor: Optional[datetime]
+    recurring: bool
+    cancelled: bool
+    deadline: float
+
+    def __init__(
+        self,
+        func: Callable[[], None],
+        interval: Optional[float] = None,
+        anchor: Optional[datetime] = None,
+        recurring: bool = False,
+    ):
+        self.func = func
+        self.interval = interval
+        self.anchor = anchor
+        self.recurring = recurring
+        self.cancelled = False
+        self.deadline = 0.0
+
+    def cancel(self):
+        """
+        Cancel the job. It will not run again.
+        """
+        self.cancelled = True
+
+
+def _get_deadline(when: datetime) -> float:
+    """
+    Convert a wall-clock datetime to a deadline on the monotonic clock.
+    """
+    return monotonic() + max(0.0, (when - datetime.now()).total_seconds())
+
+
+def _get_next_anchor(at_time: time) -> datetime:
+    """
+    Get the next wall-clock datetime at the given time of day.
+    """
+    now = datetime.now()
+    anchor = datetime.combine(now.date(), at_time)
+    if anchor <= now:
+        anchor += timedelta(days=1)
+
+    return anchor
+
+
+class Scheduler:
+    """
+    Run jobs from a heap of deadlines on the monotonic clock. The run loop
+    sleeps until the next deadline (or until jobs change), so the process
+    stays idle between jobs and does not drift with wall-clock changes.
+    """
+
+    def __init__(self):
+        self.__condition = threading.Condition()
+        self.__heap: List[Tuple[float, int, Job]] = []
+        self.__counter = itertools.count()
+        self.__stopped = False
+
+    def __push(self, deadline: float, job: Job) -> Job:
+        """
+        Add the job to the heap and wake up the run loop.
+        """
+        with self.__condition:
+            heapq.heappush(self.__heap, (deadline, next(self.__counter), job))
+            self.__condition.notify()
+
+        return job
+
+    def every(
+        self, seconds: float, func: Callable[[], None], delay: Optional[float] = None
+    ) -> Job:
+        """
+        Run the function every given seconds. The first run happens after
+        `delay` seconds, one interval from now by default.
+        """
+        if seconds <= 0:
+            raise ValueError("Interval must be greater than 0 seconds.")
+
+        job = Job(func, interval=seconds, recurring=True)
+        delay = seconds if delay is None else max(0.0, delay)
+        return self.__push(monotonic() + delay, job)
+
+    def after(self, seconds: float, func: Callable[[], None]) -> Job:
+        """
+        Run the function once after the given seconds.
+        """
+        return self.__push(monotonic() + max(0.0, seconds), Job(func))
+
+    def at(self, when: datetime, func: Callable[[], None]) -> Job:
+        """
+        Run the function once at the given wall-clock datetime.
+        """
+        return self.__push(_get_deadline(when), Job(func, anchor=when))
+
+    def daily(self, at_time: time, func: Callable[[], None]) -> Job:
+        """
+        Run the function every day at the given wall-clock time.
+        """
+        anchor = _get_next_anchor(at_time)
+        job = Job(func, anchor=anchor, recurring=True)
+        return self.__push(_get_deadline(anchor), job)
+
+    def stop(self):
+        """
+        Stop the run loop once the current job (if any) finishes.
+        """
+        with self.__condition:
+            self.__stopped = True
+            self.__condition.notify()
+
+    @property
+    def stopped(self) -> bool:
+        """
+        Whether the scheduler was stopped.
+        """
+        return self.__stopped
+
+    def __next_job(self) -> Optional[Job]:
+        """
+        Wait for the next due job. Returns None when the loop was woken up
+        before any job was due.
+        """
+        with self.__condition:
+            while self.__heap and self.__heap[0][2].cancelled:
+                heapq.heappop(self.__heap)
+
+            if self.__stopped:
+                return None
+
+            if not self.__heap:
+                self.__condition.wait()
+                return None
+
+            deadline, _, job = self.__heap[0]
+            timeout = deadline - monotonic()
+            if job.anchor:
+                # Wall-clock may jump forward, check the anchor periodically
+                wall_timeout = (job.anchor - datetime.now()).total_seconds()
+                timeout = min(timeout, wall_timeout)
+                timeout = min(timeout, WALL_CLOCK_CHECK_INTERVAL) if timeout > 0 else 0
+
+            if timeout > 0:
+                self.__condition.wait(timeout)
+                return None
+
+            heapq.heappop(self.__heap)
+            job.deadline = deadline
+
+        # Wall-clock went backwards since the deadline was computed
+        if job.anchor and datetime.now() < job.anchor:
+            self.__push(_get_deadline(job.anchor), job)
+            return None
+
+        return job
+
+    def __reschedule(self, job: Job):
+        """
+        Push the next run of a recurring job.
+        """
+        if not job.recurring or job.cancelled:
+            return
+
+        if job.anchor:
+            job.anchor = _get_next_anchor(job.anchor.time())
+            self.__push(_get_deadline(job.anchor), job)
+            return
+
+        # Keep the cadence of the interval, skipping missed runs
+        deadline = job.deadline + job.interval
+        now = monotonic()
+        if deadline <= now:
+            deadline += ((now - deadline) // job.interval + 1) * job.interval
+
+        self.__push(deadline, job)
+
+    def run(self, until: Optional[Callable[[], bool]] = None):
+        """
+        Run the due jobs until stopped or until the condition is met.
+        """
+        while not self.__stopped and not (until and until()):
+            job = self.__next_job()
+            if job is None:
+                continue
+
+            try:
+                job.func()
+            except Exception:  # pylint: disable=W0703
+                logger.exception("Scheduled job failed.")
+
+            self.__reschedule(job)
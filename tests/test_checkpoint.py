@@ -0,0 +1,126 @@
+import pytest
+
+from playtomic_scheduler.config import Profile
+from playtomic_scheduler.helpers.checkpoint import (
+    ABORTED,
+    CONFIRMED,
+    CREATED,
+    UPDATED,
+    CheckpointStore,
+)
+from playtomic_scheduler.helpers.lease import LeaseStore
+from playtomic_scheduler.helpers.reserver import Reserver
+
+EMAIL = "player@example.com"
+START_DATE = "2030-07-01T18:00:00"
+
+
+class FakePlaytomic:
+    email = EMAIL
+
+    def __init__(self, matches=None):
+        self.matches = matches or []
+        self.confirmed = []
+
+    def get_matches(self, _size, _sort, _priority=None):
+        return self.matches
+
+    def confirm_reservation(self, payment_intent_id):
+        self.confirmed.append(payment_intent_id)
+        return {"status": "CONFIRMED"}
+
+
+class SettlingLeaseStore(LeaseStore):
+    """
+    Lease store whose lease is only granted after another process settled
+    the pending booking.
+    """
+
+    def __init__(self, path, checkpoint, booking_id):
+        super().__init__(path)
+        self.checkpoint = checkpoint
+        self.booking_id = booking_id
+
+    def acquire(self, key, ttl=120):
+        self.checkpoint.advance(self.booking_id, CONFIRMED)
+        return super().acquire(key, ttl)
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    return CheckpointStore(tmp_path / "checkpoints.db")
+
+
+def build_reserver(playtomic, checkpoint, lease=None) -> Reserver:
+    profile = Profile(
+        email=EMAIL,
+        password="secret",
+        days="1,2,3,4,5,6,7",
+        hours="20:00",
+        duration=1,
+    )
+    return Reserver(playtomic, profile, lease=lease, checkpoint=checkpoint)
+
+
+def begin_booking(checkpoint, step, payment_intent_id="intent-1"):
+    booking_id = checkpoint.begin(EMAIL, "club", "court", START_DATE)
+    checkpoint.advance(booking_id, step, payment_intent_id)
+    return booking_id
+
+
+def test_resume_confirms_an_intent_that_missed_the_confirmation(checkpoint, tmp_path):
+    booking_id = begin_booking(checkpoint, UPDATED)
+    playtomic = FakePlaytomic()
+    lease = LeaseStore(tmp_path / "leases.db")
+
+    assert build_reserver(playtomic, checkpoint, lease).resume()
+    assert playtomic.confirmed == ["intent-1"]
+    assert checkpoint.get(booking_id)["step"] == CONFIRMED
+    assert not checkpoint.get_pending(EMAIL)
+
+
+def test_resume_marks_bookings_found_in_the_matches(checkpoint):
+    booking_id = begin_booking(checkpoint, CREATED)
+    playtomic = FakePlaytomic(
+        [{"start_date": START_DATE, "resource_id": "court", "status": "PENDING"}]
+    )
+
+    assert build_reserver(playtomic, checkpoint).resume()
+    assert not playtomic.confirmed
+    assert checkpoint.get(booking_id)["step"] == CONFIRMED
+
+
+def test_resume_aborts_intents_that_were_not_updated(checkpoint):
+    booking_id = begin_booking(checkpoint, CREATED)
+    playtomic = FakePlaytomic()
+
+    assert not build_reserver(playtomic, checkpoint).resume()
+    assert not playtomic.confirmed
+    assert checkpoint.get(booking_id)["step"] == ABORTED
+
+
+def test_resume_aborts_when_the_weekly_limit_was_reached(checkpoint):
+    booking_id = begin_booking(checkpoint, UPDATED)
+    playtomic = FakePlaytomic(
+        [
+            {
+                "start_date": "2030-07-02T18:00:00",
+                "resource_id": "other",
+                "status": "PENDING",
+            }
+        ]
+    )
+
+    assert not build_reserver(playtomic, checkpoint).resume()
+    assert not playtomic.confirmed
+    assert checkpoint.get(booking_id)["step"] == ABORTED
+
+
+def test_resume_skips_bookings_settled_while_awaiting_the_lease(checkpoint, tmp_path):
+    booking_id = begin_booking(checkpoint, UPDATED)
+    playtomic = FakePlaytomic()
+    lease = SettlingLeaseStore(tmp_path / "leases.db", checkpoint, booking_id)
+
+    assert not build_reserver(playtomic, checkpoint, lease).resume()
+    assert not playtomic.confirmed
+    assert checkpoint.get(booking_id)["step"] == CONFIRMED
@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import requests
+from requests.exceptions import HTTPError
+
+from playtomic_scheduler.config import Profile
+from playtomic_scheduler.helpers.planner import Planner
+from playtomic_scheduler.helpers.reserver import Reserver
+
+
+class FakePlaytomic:
+    email = "player@example.com"
+
+    def fetch_availability(self, tenant_id, start_date, _end_date):
+        if tenant_id == "broken-club":
+            response = requests.Response()
+            response.status_code = 500
+            raise HTTPError("500 Server Error", response=response)
+
+        return [
+            {
+                "resource_id": f"{tenant_id}-court",
+                "start_date": start_date.strftime("%Y-%m-%d"),
+                "slots": [
+                    {"start_time": "18:00:00", "duration": 60, "price": "20 EUR"}
+                ],
+            }
+        ]
+
+
+def build_planner() -> Planner:
+    profile = Profile(
+        email="player@example.com",
+        password="secret",
+        days="1,2,3,4,5,6,7",
+        hours="18:00,19:00,20:00",
+        duration=1,
+        tenants=[
+            {"id": "club", "name": "CLUB"},
+            {"id": "broken-club", "name": "BROKEN CLUB"},
+        ],
+    )
+    return Planner(Reserver(FakePlaytomic(), profile, scan_mode="day"))
+
+
+def test_default_range_covers_a_week():
+    planner = build_planner()
+    start_date, end_date = Planner.get_default_range(datetime(2024, 7, 1, 15))
+
+    assert len(planner.get_plan_dates(start_date, end_date)) == 7
+
+
+def test_failed_windows_do_not_lose_the_plan():
+    planner = build_planner()
+    tenants = planner.reserver.profile.tenants
+
+    slots = planner.plan(tenants, datetime(2024, 7, 1), datetime(2024, 7, 3))
+
+    assert {slot["tenant_id"] for slot in slots} == {"club"}
+    assert len(slots) == 3
+    assert [
+        (tenant.id, window_start.day)
+        for tenant, window_start, _ in sorted(
+            planner.failed_windows, key=lambda window: window[1]
+        )
+    ] == [("broken-club", 1), ("broken-club", 2), ("broken-club", 3)]
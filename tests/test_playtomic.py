@@ -0,0 +1,45 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from playtomic_scheduler.helpers.playtomic import Playtomic
+from playtomic_scheduler.helpers.ratelimit import BOOKING, SCAN
+
+
+class SlowResponse:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return []
+
+
+def count_concurrent_requests(priority) -> int:
+    playtomic = Playtomic("player@example.com", "secret", limiter=False)
+    playtomic.access_token = "token"
+    playtomic.user_id = "player"
+
+    calls = []
+    lock = threading.Lock()
+
+    def get(*_args, **_kwargs):
+        with lock:
+            calls.append(priority)
+        time.sleep(0.2)
+        return SlowResponse()
+
+    playtomic.session.get = get
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in range(4):
+            executor.submit(playtomic.get_matches, 10, "start_date,desc", priority)
+
+    return len(calls)
+
+
+def test_scan_reads_are_coalesced():
+    assert count_concurrent_requests(SCAN) == 1
+
+
+def test_booking_reads_are_always_sent():
+    assert count_concurrent_requests(BOOKING) == 4
@@ -0,0 +1,45 @@
+from datetime import time
+
+from playtomic_scheduler.config import Profile
+
+
+def build_profile(**kwargs) -> Profile:
+    return Profile(
+        **{
+            "email": "player@example.com",
+            "password": "secret",
+            "days": "2,3",
+            "hours": "20:00",
+            "duration": 1.5,
+            "tenants": [{"id": "club-1", "name": "CLUB 1"}],
+            **kwargs,
+        }
+    )
+
+
+def test_profile_days_are_zero_based():
+    assert build_profile().days == {1, 2}
+
+
+def test_default_watch_keeps_the_profile_days():
+    (rule,) = build_profile().get_watches()
+
+    assert rule.name == "preferences"
+    assert rule.days == {1, 2}
+    assert rule.hours == {time(20, 0)}
+    assert rule.duration == 1.5
+    assert rule.tenants == {"club-1"}
+
+
+def test_default_watch_includes_monday_and_sunday():
+    (rule,) = build_profile(days="1,7").get_watches()
+
+    assert rule.days == {0, 6}
+
+
+def test_configured_watches_take_precedence():
+    profile = build_profile(watches=[{"name": "weekend", "days": "6,7"}])
+
+    (rule,) = profile.get_watches()
+    assert rule.name == "weekend"
+    assert rule.days == {5, 6}
@@ -0,0 +1,64 @@
+import pytest
+from pydantic import ValidationError
+
+from playtomic_scheduler.config import settings
+from playtomic_scheduler.config.config import Settings
+from playtomic_scheduler.helpers.playtomic import Playtomic
+from playtomic_scheduler.helpers.ratelimit import (
+    BOOKING,
+    SCAN,
+    RateLimiter,
+    RateLimitTimeout,
+)
+
+# Slow enough for the bucket not to refill during a test
+RATE = 0.001
+
+
+def test_scans_cannot_use_the_reserved_tokens(tmp_path):
+    limiter = RateLimiter(RATE, burst=3, reserved=1, path=tmp_path / "rate.db")
+
+    limiter.acquire(SCAN, timeout=0)
+    limiter.acquire(SCAN, timeout=0)
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire(SCAN, timeout=0)
+
+    limiter.acquire(BOOKING, timeout=0)
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire(BOOKING, timeout=0)
+
+
+def test_bookings_are_not_blocked_by_drained_scans(tmp_path):
+    limiter = RateLimiter(RATE, burst=4, reserved=2, path=tmp_path / "rate.db")
+
+    limiter.acquire(SCAN, timeout=0)
+    limiter.acquire(SCAN, timeout=0)
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire(SCAN, timeout=0)
+
+    limiter.acquire(BOOKING, timeout=0)
+    limiter.acquire(BOOKING, timeout=0)
+
+
+def test_limiters_on_the_same_file_share_the_budget(tmp_path):
+    path = tmp_path / "rate.db"
+    RateLimiter(RATE, burst=2, reserved=0, path=path).acquire(SCAN, timeout=0)
+    RateLimiter(RATE, burst=2, reserved=0, path=path).acquire(SCAN, timeout=0)
+
+    with pytest.raises(RateLimitTimeout):
+        RateLimiter(RATE, burst=2, reserved=0, path=path).acquire(SCAN, timeout=0)
+
+
+def test_settings_reject_reserving_the_whole_burst():
+    with pytest.raises(ValidationError):
+        Settings(PLAYTOMIC_RATE_BURST=2, PLAYTOMIC_RATE_RESERVED=2)
+
+    Settings(PLAYTOMIC_RATE_LIMIT=0, PLAYTOMIC_RATE_BURST=2, PLAYTOMIC_RATE_RESERVED=2)
+
+
+def test_disabled_limiter_does_not_create_its_database(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "config_path", str(tmp_path))
+
+    assert Playtomic("player@example.com", "secret", limiter=False).limiter is None
+    assert Playtomic("player@example.com", "secret", limiter=None).limiter is None
+    assert not list(tmp_path.iterdir())
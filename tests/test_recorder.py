@@ -0,0 +1,64 @@
+import gzip
+import json
+
+import requests
+
+from playtomic_scheduler.helpers.recorder import ReplayAdapter
+
+API_URL = "https://playtomic.io/api/v1"
+
+
+def write_recording(path, records):
+    with gzip.open(path, "wt", encoding="utf-8") as recording:
+        for url, body in records:
+            record = {
+                "method": "GET",
+                "url": url,
+                "status_code": 200,
+                "reason": "OK",
+                "headers": {},
+                "body": json.dumps(body),
+                "elapsed": 0,
+            }
+            recording.write(json.dumps(record) + "\n")
+
+
+def build_session(path) -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", ReplayAdapter(path, latency_scale=0))
+    return session
+
+
+def test_replay_serves_every_record_once(tmp_path):
+    path = tmp_path / "scan.jsonl.gz"
+    write_recording(
+        path,
+        [
+            (f"{API_URL}/availability?day=1", 1),
+            (f"{API_URL}/availability?day=2", 2),
+            (f"{API_URL}/availability?day=3", 3),
+        ],
+    )
+    session = build_session(path)
+
+    # A path match must not be served again by its exact URL
+    assert session.get(f"{API_URL}/availability?day=9").json() == 1
+    assert session.get(f"{API_URL}/availability?day=1").json() == 2
+    assert session.get(f"{API_URL}/availability?day=3").json() == 3
+    assert session.get(f"{API_URL}/availability?day=2").status_code == 404
+
+
+def test_replay_prefers_the_exact_url(tmp_path):
+    path = tmp_path / "scan.jsonl.gz"
+    write_recording(
+        path,
+        [
+            (f"{API_URL}/availability?day=1", 1),
+            (f"{API_URL}/availability?day=2", 2),
+        ],
+    )
+    session = build_session(path)
+
+    assert session.get(f"{API_URL}/availability?day=2").json() == 2
+    assert session.get(f"{API_URL}/availability?day=2").json() == 1
+    assert session.get(f"{API_URL}/matches").status_code == 404
@@ -0,0 +1,73 @@
+import json
+import logging
+import threading
+
+import pytest
+from click.testing import CliRunner
+from waitress.server import create_server
+
+from playtomic_scheduler.config import settings
+from playtomic_scheduler.commands import plan, replay
+from playtomic_scheduler.helpers.fakeapi import (
+    FakeApi,
+    build_catalogue,
+    create_fake_app,
+)
+
+
+@pytest.fixture
+def api_url(monkeypatch, tmp_path):
+    tenants = build_catalogue(2, 2)
+    server = create_server(create_fake_app(FakeApi(tenants)), host="127.0.0.1", port=0)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    url = f"http://127.0.0.1:{server.effective_port}/api"
+    monkeypatch.setattr(settings, "config_path", str(tmp_path))
+    monkeypatch.setattr(settings, "api_url", f"{url}/v1")
+    monkeypatch.setattr(settings, "auth_url", f"{url}/v3")
+    monkeypatch.setattr(settings, "rate_limit", 0)
+
+    config = {
+        "email": "player@example.com",
+        "password": "secret",
+        "days": "1,2,3,4,5,6,7",
+        "hours": "18:00,19:00,20:00",
+        "duration": 1,
+        "tenants": [tenant.model_dump() for tenant in tenants],
+    }
+    (tmp_path / "config.json").write_text(json.dumps(config))
+
+    yield url
+
+    server.close()
+
+
+def test_plan_recording_replays_offline(api_url, caplog):
+    caplog.set_level(logging.INFO, logger="playtomic-scheduler-cli")
+    runner = CliRunner()
+
+    result = runner.invoke(plan, ["--record", "scan", "--output", "json"])
+    assert result.exit_code == 0, result.output
+    planned = json.loads(result.output)
+    assert planned
+
+    caplog.clear()
+    result = runner.invoke(replay, ["scan", "--latency-scale", "0"])
+    assert result.exit_code == 0, result.output
+    assert f"Replayed scan found {len(planned)} matching slots." in caplog.messages
+    assert not [message for message in caplog.messages if "not in the" in message]
+
+
+def test_replay_reports_requests_missing_from_the_recording(api_url, caplog):
+    caplog.set_level(logging.INFO, logger="playtomic-scheduler-cli")
+    runner = CliRunner()
+
+    result = runner.invoke(plan, ["--record", "scan", "--days", "1"])
+    assert result.exit_code == 0, result.output
+
+    # Every day is scanned on replay, but only Mondays were recorded
+    caplog.clear()
+    result = runner.invoke(replay, ["scan", "--latency-scale", "0"])
+    assert result.exit_code == 0, result.output
+    assert any("were skipped" in message for message in caplog.messages)